@@ -3,16 +3,248 @@ BigFuture Scholarship Detail Scraper
 Scrapes detailed information from BigFuture scholarship pages using specific selectors
 """
 
+import asyncio
+import queue
 import requests
 from bs4 import BeautifulSoup
+from bs4.element import CData, NavigableString, Tag
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 import json
+import os
 import time
 import re
-from typing import Dict, Any, Optional, List
+from dataclasses import dataclass, field
+from urllib.parse import urljoin
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Any, Iterator, Optional, List
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import NoSuchDriverException, TimeoutException, WebDriverException
+from page_cache import PageCache, fingerprint
+
+# JSON writer resolved once at import, not per saved file
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Present once a scholarship page (name or details) or the not-found banner has rendered
+_PAGE_READY_CSS = '.sc-c64e2d48-3, .cb-accordion-container, div.errorBannerTitle'
+# Seconds between page-ready checks; Selenium's default of 0.5 adds up to
+# half a second to every page
+_PAGE_READY_POLL = 0.2
+# After "Expand All": true once every accordion panel has content (the
+# browser-side twin of _has_unrendered_panels), and how long to wait for it
+_PANELS_RENDERED_JS = """
+return Array.from(document.querySelectorAll('div.cb-accordion-container')).every(function (c) {
+    var panel = c.querySelector('div.cb-accordion-panel-content');
+    return !!(panel && panel.textContent.trim());
+});
+"""
+_PANELS_TIMEOUT = 2
+# Chrome launches tried before giving up; browsers started together can
+# collide on chromedriver's port
+_DRIVER_START_ATTEMPTS = 3
+# Rough memory of one headless Chrome; a ScraperPool starts no more browsers
+# than fit in half of physical RAM
+_BROWSER_MEMORY = 150 * 1024 * 1024
+# Third-party trackers blocked through Chrome DevTools (Network.setBlockedURLs);
+# images, stylesheets and fonts are already off via content settings
+_BLOCKED_URLS = ['*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*']
+# Pooled connections per host for self.session, enough for threaded batches
+_HTTP_POOL_SIZE = 50
+# Retry requests on rate limiting and transient gateway errors, with
+# exponential backoff (a 429's Retry-After is honoured)
+_HTTP_RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 502, 503, 504))
+
+# Patterns used on every page, compiled once
+_AMOUNT_RE = re.compile(r'\$[\d,]+')
+_OPENS_RE = re.compile(r'Opens:\s*(\d{1,2}/\d{1,2}/\d{4})')
+_CLOSES_RE = re.compile(r'Closes:\s*(\d{1,2}/\d{1,2}/\d{4})')
+_ONCLICK_URL_RE = re.compile(r'https?://[^\s\'\"\)]+')
+_FILENAME_UNSAFE_RE = re.compile(r'[^\w\s-]')
+
+# Keyword alternations: one regex scan per line instead of a substring test
+# per keyword. No word boundaries, so 'Fund' still matches 'Funding'
+# Words that mark a line as an organization name
+_ORG_RE = re.compile(r'Association|Foundation|Fund|Trust|Society|Organization|Council|Committee|Institute|Center')
+# Words that mark a list item as a requirement
+_REQ_KEYWORD_RE = re.compile(r'Resident|Attend|Student|Seeking|Studying|Degree|Grade')
+# Keywords that indicate location information
+_LOCATION_RE = re.compile(r'Country|State|County|City|Region|Zip|Postal')
+# Keywords that indicate NON-location fields (should be excluded from location)
+_NON_LOCATION_RE = re.compile(r'GPA|Activities|Community Service|Extracurricular|Leadership|'
+                              r'Affiliations|ROTC|Essay|Merit|Need')
+
+# Section lines that end the Requirements list
+_REQ_STOP = frozenset({'Details', 'Expand All', 'Collapse All', 'Pursued Degree Level', 'Next Steps'})
+# Section lines that end the Details list, and the accordion buttons inside it
+_DETAILS_STOP = frozenset({'Next Steps', 'Match With Scholarships', 'See All Scholarships'})
+_ACCORDION_CONTROLS = frozenset({'Expand All', 'Collapse All'})
+# Category headers in the Details text
+_CATEGORY_HEADERS = frozenset({'Pursued Degree Level', 'Current Grade', 'Location',
+                               'Current School', 'Intended Area of Study'})
+_CATEGORY_HEADER_RE = re.compile('|'.join(map(re.escape, sorted(_CATEGORY_HEADERS))))
+
+# Text and selectors looked up on every page by the flag, URL and
+# page-exists checks
+_FLAG_NEEDLES = ('Essay Required', 'Need-Based', 'Merit-Based')
+_FLAG_RE = re.compile('|'.join(map(re.escape, _FLAG_NEEDLES)))
+_FLAG_KEYS = {'Essay Required': 'essay_required', 'Need-Based': 'need_based',
+              'Merit-Based': 'merit_based'}
+_WEBSITE_NEEDLES = ('Website',)
+_APPLY_NEEDLES = ('Apply Now',)
+_ERROR_BANNER_CSS = 'div.errorBannerTitle'
+
+# Elements rendered as blocks: each starts and ends a line of body text, the
+# way Selenium's .text lays them out
+_BLOCK_TAGS = frozenset({
+    'address', 'article', 'aside', 'blockquote', 'caption', 'dd', 'details', 'dialog',
+    'div', 'dl', 'dt', 'fieldset', 'figcaption', 'figure', 'footer', 'form',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hgroup', 'hr', 'legend', 'li',
+    'main', 'nav', 'ol', 'p', 'pre', 'section', 'summary', 'table', 'tr', 'ul',
+})
+# Elements whose contents are never rendered as text
+_NON_TEXT_TAGS = frozenset({'head', 'script', 'style', 'noscript', 'template'})
+# Marks the end of a block element in _block_lines()
+_LINE_BREAK = object()
+
+
+def _element_text(elem) -> str:
+    """Text of an element with whitespace collapsed, like Selenium's .text"""
+    return ' '.join(elem.get_text().split())
+
+
+def _block_lines(root) -> List[str]:
+    """
+    Text of root as rendered lines: one per block element (or <br>), inline
+    elements joined into their block's line, whitespace collapsed, empty
+    lines dropped. Table cells on a row are separated by a space.
+    """
+    lines = []
+    parts = []
+    
+    def end_line():
+        if parts:
+            line = ' '.join(''.join(parts).split())
+            if line:
+                lines.append(line)
+            parts.clear()
+    
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node is _LINE_BREAK:
+            end_line()
+        elif isinstance(node, Tag):
+            name = node.name
+            if name in _NON_TEXT_TAGS:
+                continue
+            if name == 'br':
+                end_line()
+                continue
+            if name in _BLOCK_TAGS:
+                end_line()
+                stack.append(_LINE_BREAK)
+            elif name in ('td', 'th'):
+                parts.append(' ')
+            stack.extend(reversed(node.contents))
+        elif type(node) in (NavigableString, CData):
+            # Comments, doctypes and script/style strings are other subclasses
+            parts.append(node)
+    end_line()
+    return lines
+
+
+def _is_location_line(line: str) -> bool:
+    """A Location line: a location keyword and none of the non-location ones, in one regex pass each"""
+    return bool(_LOCATION_RE.search(line)) and not _NON_LOCATION_RE.search(line)
+
+
+def _first_text(soup: BeautifulSoup, selectors: List[str]) -> Optional[str]:
+    """Return the first non-empty text among elements matching the selectors, in order"""
+    for selector in selectors:
+        # iselect matches lazily, so the scan stops at the first hit
+        for elem in soup.css.iselect(selector):
+            text = _element_text(elem)
+            if text:
+                return text
+    return None
+
+
+def _elements_containing(strings: List[Any], needles) -> Iterator[Any]:
+    """
+    Lazily yield elements whose own text contains any of the needles, in
+    document order, so callers that need one match stop scanning there.
+    Equivalent of the XPath //*[contains(text(), ...)] lookups; strings is
+    PageContext.text_nodes(), which skips script, style and comment contents.
+    """
+    seen = set()
+    for string in strings:
+        if not any(needle in string for needle in needles):
+            continue
+        parent = string.parent
+        # Tags compare by content, so dedupe on identity
+        if id(parent) not in seen:
+            seen.add(id(parent))
+            yield parent
+
+
+@dataclass
+class PageContext:
+    """Everything the extractors read from one parsed page, built once per page"""
+    soup: BeautifulSoup
+    # Body text, one rendered block per line (see _block_lines)
+    body_text: str
+    lines: List[str]
+    # Line index of the first "About the Scholarship", "Requirements" and
+    # "Details" headings
+    sections: Dict[str, int]
+    # Line index of the first line mentioning "About the Scholarship" or
+    # "Requirements" anywhere in it (e.g. "Eligibility Requirements"); the
+    # foundation name is searched for just above it
+    first_heading_mention: Optional[int]
+    # soup.strings, collected on first use by text_nodes()
+    _strings: Optional[List[Any]] = field(default=None, repr=False)
+    
+    def text_nodes(self) -> List[Any]:
+        """
+        Every text node on the page, as soup.strings yields them. The tree is
+        walked once; the flag, URL and fallback text lookups then scan this list.
+        """
+        if self._strings is None:
+            self._strings = list(self.soup.strings)
+        return self._strings
+    
+    @classmethod
+    def from_soup(cls, soup: BeautifulSoup) -> 'PageContext':
+        """Serialize the body text and index the section headings in one pass"""
+        lines = _block_lines(soup.body or soup)
+        body_text = '\n'.join(lines)
+        sections = {}
+        first_heading_mention = None
+        for i, line in enumerate(lines):
+            if 'About the Scholarship' in line:
+                sections.setdefault('About the Scholarship', i)
+                if first_heading_mention is None:
+                    first_heading_mention = i
+            else:
+                if first_heading_mention is None and 'Requirements' in line:
+                    first_heading_mention = i
+                stripped = line.strip()
+                if stripped in ('Requirements', 'Details'):
+                    sections.setdefault(stripped, i)
+        return cls(soup, body_text, lines, sections, first_heading_mention)
+
+
+# Marks batch results for pages whose error banner was found
+_PAGE_NOT_FOUND = object()
 
 
 class PageNotFoundError(Exception):
@@ -23,16 +255,39 @@ class PageNotFoundError(Exception):
 class BigFutureScraper:
     """Scraper specifically designed for BigFuture scholarship pages"""
     
-    def __init__(self):
+    def __init__(self, cache_path: Optional[str] = None, cache_max_age: Optional[float] = None,
+                 remote_url: Optional[str] = None):
+        """
+        Args:
+            cache_path: Optional SQLite file for the conditional-request cache;
+                re-scrapes of unchanged pages then reuse the stored data
+            cache_max_age: Seconds for which cached data is returned without
+                contacting the server at all (needs cache_path); pass
+                force=True to a scrape method to bypass the cache
+            remote_url: Selenium Grid (or standalone-chrome) address, e.g.
+                http://localhost:4444; the browser then runs there instead
+                of as a local Chrome
+        """
+        self.cache = PageCache(cache_path) if cache_path else None
+        self.cache_max_age = cache_max_age
+        self.remote_url = remote_url
+        # Started on first use and reused across scrapes (see close())
+        self.driver = None
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
+            # Only encodings requests can decode here: 'br' when brotli is installed
+            'Accept-Encoding': DEFAULT_ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
+        # Pool sized for threaded batches, and retries on transient gateway errors
+        adapter = HTTPAdapter(pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE,
+                              max_retries=_HTTP_RETRY)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
         # BigFuture-specific CSS selectors and patterns
         # We'll add more div hints later as needed
@@ -61,19 +316,84 @@ class BigFutureScraper:
             ],
         }
     
-    def _setup_driver(self) -> webdriver.Chrome:
-        """Setup and configure Chrome driver"""
+    def _setup_driver(self) -> webdriver.Remote:
+        """Setup and configure Chrome driver (a remote session if remote_url is set)"""
         options = Options()
         options.add_argument('--headless')
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--disable-blink-features=AutomationControlled')
+        options.add_argument('--disable-gpu')
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
-        return webdriver.Chrome(options=options)
+        # Scholarship text is in the DOM: don't wait for the load event
+        # (images, fonts, beacons) and don't download images, stylesheets,
+        # fonts or plugins at all (2 = block)
+        options.page_load_strategy = 'eager'
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+            "profile.managed_default_content_settings.plugins": 2,
+        })
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        if self.remote_url:
+            # Remote sessions have no execute_cdp_cmd; trackers load there
+            driver = webdriver.Remote(command_executor=self.remote_url, options=options)
+        else:
+            driver = webdriver.Chrome(options=options)
+        try:
+            if not self.remote_url:
+                # Analytics and ad scripts are never read either; block them in the
+                # network layer so they don't compete with the page's own requests
+                driver.execute_cdp_cmd('Network.enable', {})
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URLS})
+            driver.set_page_load_timeout(20)
+            # All waiting goes through the one explicit page-ready wait in scrape();
+            # a missing element must fail immediately, never after an implicit timeout
+            driver.implicitly_wait(0)
+        except Exception:
+            # The browser is running: quit it before _get_driver() retries
+            driver.quit()
+            raise
+        return driver
     
-    def _expand_all_sections(self, driver: webdriver.Chrome) -> None:
+    def _get_driver(self) -> webdriver.Remote:
+        """Chrome instance shared by every scrape() call until close()"""
+        if self.driver is None:
+            for attempt in range(1, _DRIVER_START_ATTEMPTS + 1):
+                try:
+                    self.driver = self._setup_driver()
+                    break
+                except NoSuchDriverException:
+                    # No Chrome/chromedriver installed: retrying won't help
+                    raise
+                except WebDriverException as e:
+                    if attempt == _DRIVER_START_ATTEMPTS:
+                        raise
+                    print(f"  Chrome failed to start ({e.msg}), retrying...")
+                    time.sleep(attempt)
+        return self.driver
+    
+    def close(self) -> None:
+        """Quit the shared Chrome instance, if one was started"""
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+    
+    def __enter__(self) -> 'BigFutureScraper':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def _expand_all_sections(self, driver: webdriver.Remote) -> None:
         """Try to expand all collapsible sections, specifically the Details accordion"""
+        # Missing, stale or unclickable buttons all raise WebDriverException
+        # subclasses; anything else (including Ctrl-C) propagates
         try:
             # First, try to find "Expand All" button within the accordion buttons container
             try:
@@ -82,143 +402,91 @@ class BigFutureScraper:
                 if expand_buttons:
                     try:
                         expand_buttons[0].click()
-                        time.sleep(2)  # Wait longer for accordion to expand
-                    except:
+                        self._wait_for_panels(driver)
+                    except WebDriverException:
                         try:
                             driver.execute_script("arguments[0].click();", expand_buttons[0])
-                            time.sleep(2)
-                        except:
+                            self._wait_for_panels(driver)
+                        except WebDriverException:
                             pass
-            except:
+            except WebDriverException:
                 # Fallback: try general "Expand All" button
                 expand_buttons = driver.find_elements(By.XPATH, "//*[contains(text(), 'Expand All')]")
                 if expand_buttons:
                     try:
                         expand_buttons[0].click()
-                        time.sleep(2)
-                    except:
+                        self._wait_for_panels(driver)
+                    except WebDriverException:
                         try:
                             driver.execute_script("arguments[0].click();", expand_buttons[0])
-                            time.sleep(2)
-                        except:
+                            self._wait_for_panels(driver)
+                        except WebDriverException:
                             pass
-        except:
+        except WebDriverException:
             pass
     
-    def _extract_name(self, driver: webdriver.Chrome) -> Optional[str]:
-        """Extract scholarship name using CSS class sc-c64e2d48-3 (any HTML tag)"""
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
+    def _wait_for_panels(self, driver: webdriver.Remote) -> None:
+        """
+        After clicking "Expand All", wait (up to the 2 seconds previously
+        slept unconditionally) until every accordion panel has content.
+        """
+        try:
+            WebDriverWait(driver, _PANELS_TIMEOUT, poll_frequency=_PAGE_READY_POLL).until(
+                lambda d: d.execute_script(_PANELS_RENDERED_JS)
+            )
+        except TimeoutException:
+            pass
+    
+    def _snapshot(self, driver: webdriver.Remote) -> BeautifulSoup:
+        """
+        Grab the rendered DOM once and parse it in-process.
         
+        Every extractor reads from this tree, so a page costs one
+        page_source round trip instead of dozens of find_element calls.
+        """
+        return BeautifulSoup(driver.page_source, 'lxml')
+    
+    def _has_unrendered_panels(self, soup: BeautifulSoup) -> bool:
+        """True if an accordion section has no panel content in the DOM yet"""
+        for container in soup.select('div.cb-accordion-container'):
+            panel_content = container.select_one('div.cb-accordion-panel-content')
+            if panel_content is None or not panel_content.get_text(strip=True):
+                return True
+        return False
+    
+    def _extract_name(self, page: PageContext) -> Optional[str]:
+        """Extract scholarship name using CSS class sc-c64e2d48-3 (any HTML tag)"""
         # Search by CSS class only, not specific HTML tag
         selectors = [
-            (By.CSS_SELECTOR, '.sc-c64e2d48-3'),  # CSS class selector (any tag)
-            (By.CSS_SELECTOR, '[class="sc-c64e2d48-3"]'),  # Exact class attribute match
-            (By.CSS_SELECTOR, '[class*="sc-c64e2d48-3"]'),  # Contains class (handles multiple classes)
-            (By.XPATH, '//*[@class="sc-c64e2d48-3"]'),  # XPath exact class (any tag)
-            (By.XPATH, '//*[contains(@class, "sc-c64e2d48-3")]'),  # XPath with contains (any tag)
+            '.sc-c64e2d48-3',  # CSS class selector (any tag)
+            '[class*="sc-c64e2d48-3"]',  # Contains class (handles multiple classes)
         ]
-        
-        # First try with explicit wait
-        for by, selector in selectors:
-            try:
-                name_elem = WebDriverWait(driver, 5).until(
-                    EC.presence_of_element_located((by, selector))
-                )
-                name = name_elem.text.strip()
-                if name:
-                    return name
-            except:
-                continue
-        
-        # Fallback: try without wait (element might already be loaded)
-        for by, selector in selectors:
-            try:
-                name_elem = driver.find_element(by, selector)
-                name = name_elem.text.strip()
-                if name:
-                    return name
-            except:
-                continue
-        
-        # Last resort: try find_elements to see if any match
-        try:
-            elements = driver.find_elements(By.CSS_SELECTOR, '[class*="sc-c64e2d48-3"]')
-            for elem in elements:
-                name = elem.text.strip()
-                if name:
-                    return name
-        except:
-            pass
-        
-        return None
+        return _first_text(page.soup, selectors)
     
-    def _extract_foundation(self, driver: webdriver.Chrome) -> Optional[str]:
+    def _extract_foundation(self, page: PageContext) -> Optional[str]:
         """
         Extract foundation/organization name using CSS class sc-c64e2d48-4.
         This should be the foundation or organization offering the scholarship,
         NOT the student's current school or grade level.
         """
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        
         # Search by CSS class sc-c64e2d48-4 (similar to how name uses sc-c64e2d48-3)
         selectors = [
-            (By.CSS_SELECTOR, '.sc-c64e2d48-4'),  # CSS class selector (any tag)
-            (By.CSS_SELECTOR, '[class="sc-c64e2d48-4"]'),  # Exact class attribute match
-            (By.CSS_SELECTOR, '[class*="sc-c64e2d48-4"]'),  # Contains class (handles multiple classes)
-            (By.CSS_SELECTOR, '.sc-c64e2d48-4.jJZZsb'),  # Both classes together
-            (By.CSS_SELECTOR, '[class*="sc-c64e2d48-4"][class*="jJZZsb"]'),  # Contains both classes
-            (By.XPATH, '//*[@class="sc-c64e2d48-4"]'),  # XPath exact class (any tag)
-            (By.XPATH, '//*[contains(@class, "sc-c64e2d48-4")]'),  # XPath with contains (any tag)
+            '.sc-c64e2d48-4',  # CSS class selector (any tag)
+            '[class*="sc-c64e2d48-4"]',  # Contains class (handles multiple classes)
         ]
-        
-        # First try with explicit wait
-        for by, selector in selectors:
-            try:
-                foundation_elem = WebDriverWait(driver, 5).until(
-                    EC.presence_of_element_located((by, selector))
-                )
-                foundation = foundation_elem.text.strip()
-                if foundation:
-                    return foundation
-            except:
-                continue
-        
-        # Fallback: try without wait (element might already be loaded)
-        for by, selector in selectors:
-            try:
-                foundation_elem = driver.find_element(by, selector)
-                foundation = foundation_elem.text.strip()
-                if foundation:
-                    return foundation
-            except:
-                continue
-        
-        # Last resort: try find_elements to see if any match
-        try:
-            elements = driver.find_elements(By.CSS_SELECTOR, '[class*="sc-c64e2d48-4"]')
-            for elem in elements:
-                foundation = elem.text.strip()
-                if foundation:
-                    return foundation
-        except:
-            pass
+        soup = page.soup
+        foundation = _first_text(soup, selectors)
+        if foundation:
+            return foundation
         
         # Final fallback: old text-based method
         try:
-            # Get all text elements and look for organization-like names
             # Organization name is usually near the top, after the scholarship name
-            page_text = driver.find_element(By.TAG_NAME, "body").text
-            lines = page_text.split('\n')
+            lines = page.lines
             
             # Look for patterns that indicate organization names
             # Usually appears before "About the Scholarship" or "Requirements"
-            about_idx = None
-            for i, line in enumerate(lines):
-                if 'About the Scholarship' in line or 'Requirements' in line:
-                    about_idx = i
-                    break
+            about_idx = page.first_heading_mention
             
             # Search backwards from "About" to find organization name
             if about_idx:
@@ -229,9 +497,7 @@ class BigFutureScraper:
                     if not line or line.startswith('$') or 'Opens:' in line or 'Closes:' in line:
                         continue
                     # Look for organization indicators first (highest priority)
-                    org_keywords = ['Association', 'Foundation', 'Fund', 'Trust', 'Society', 
-                                   'Organization', 'Council', 'Committee', 'Institute', 'Center']
-                    if any(keyword in line for keyword in org_keywords):
+                    if _ORG_RE.search(line):
                         return line
                 
                 # If no org keywords found, try generic organization pattern
@@ -244,30 +510,24 @@ class BigFutureScraper:
                     # Skip if it's too long (likely description)
                     if len(line) > 60:
                         continue
-                    # Check if it looks like an organization (2-6 words, capitalized)
+                    # Check if it looks like an organization (2-6 words, capitalized).
+                    # A capitalized first character also rules out dates and amounts
                     words = line.split()
                     if 2 <= len(words) <= 6 and line[0].isupper():
-                        # Check if it's not a date or amount
-                        if not re.match(r'^\$|^\d+/\d+', line):
-                            return line
+                        return line
             
             # Alternative: Look for specific divs that might contain organization info
-            try:
-                # Try to find organization in meta tags or structured data
-                org_elements = driver.find_elements(By.XPATH, 
-                    "//*[contains(@class, 'organization') or contains(@class, 'sponsor') or contains(@class, 'foundation')]")
-                for elem in org_elements:
-                    text = elem.text.strip()
-                    if text and 5 < len(text) < 100:
-                        return text
-            except:
-                pass
+            org_elements = soup.select('[class*="organization"], [class*="sponsor"], [class*="foundation"]')
+            for elem in org_elements:
+                text = _element_text(elem)
+                if text and 5 < len(text) < 100:
+                    return text
         except Exception as e:
             print(f"Error extracting foundation: {e}")
         
         return None
     
-    def _extract_status(self, driver: webdriver.Chrome) -> Optional[str]:
+    def _extract_status(self, page: PageContext) -> Optional[str]:
         """
         Extract application status.
         
@@ -276,143 +536,69 @@ class BigFutureScraper:
         We'll search by that class (any tag) and fall back to a
         text-based search if needed.
         """
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-
         # Prefer CSS class selector so we're resilient to tag changes
         selectors = [
-            (By.CSS_SELECTOR, '.sc-c64e2d48-10'),
-            (By.CSS_SELECTOR, '[class*="sc-c64e2d48-10"]'),
-            (By.XPATH, '//*[@class="sc-c64e2d48-10"]'),
-            (By.XPATH, '//*[contains(@class, "sc-c64e2d48-10")]'),
+            '.sc-c64e2d48-10',
+            '[class*="sc-c64e2d48-10"]',
         ]
-
-        # Try with an explicit wait first
-        for by, selector in selectors:
-            try:
-                elem = WebDriverWait(driver, 5).until(
-                    EC.presence_of_element_located((by, selector))
-                )
-                text = elem.text.strip()
-                if text:
-                    return text
-            except Exception:
-                continue
-
-        # Fallback: direct find without wait
-        for by, selector in selectors:
-            try:
-                elem = driver.find_element(by, selector)
-                text = elem.text.strip()
-                if text:
-                    return text
-            except Exception:
-                continue
-
+        status = _first_text(page.soup, selectors)
+        if status:
+            return status
+        
         # Final fallback: old text-based search
-        try:
-            status_elem = driver.find_element(
-                By.XPATH,
-                "//*[contains(text(), 'Accepting Applications') or "
-                "contains(text(), 'Not Accepting')]",
-            )
-            return status_elem.text.strip()
-        except Exception:
-            return None
+        for elem in _elements_containing(page.text_nodes(), ('Accepting Applications', 'Not Accepting')):
+            return _element_text(elem)
+        return None
     
-    def _extract_amount(self, driver: webdriver.Chrome) -> Optional[str]:
+    def _extract_amount(self, page: PageContext) -> Optional[str]:
         """Extract scholarship amount using CSS class sc-d233e5e8-0"""
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        
         # Prefer CSS class selector
         selectors = [
-            (By.CSS_SELECTOR, '.sc-d233e5e8-0'),
-            (By.CSS_SELECTOR, '[class*="sc-d233e5e8-0"]'),
-            (By.XPATH, '//*[@class="sc-d233e5e8-0"]'),
-            (By.XPATH, '//*[contains(@class, "sc-d233e5e8-0")]'),
+            '.sc-d233e5e8-0',
+            '[class*="sc-d233e5e8-0"]',
         ]
-        
-        # Try with an explicit wait first
-        for by, selector in selectors:
-            try:
-                elem = WebDriverWait(driver, 5).until(
-                    EC.presence_of_element_located((by, selector))
-                )
-                amount_text = elem.text.strip()
-                if amount_text:
-                    # Extract dollar amount if present
-                    amount_match = re.search(r'\$[\d,]+', amount_text)
-                    if amount_match:
-                        return amount_match.group()
-                    return amount_text
-            except:
-                continue
-        
-        # Fallback: try without wait
-        for by, selector in selectors:
-            try:
-                elem = driver.find_element(by, selector)
-                amount_text = elem.text.strip()
-                if amount_text:
-                    # Extract dollar amount if present
-                    amount_match = re.search(r'\$[\d,]+', amount_text)
-                    if amount_match:
-                        return amount_match.group()
-                    return amount_text
-            except:
-                continue
-        
-        # Last resort: try find_elements
-        try:
-            elements = driver.find_elements(By.CSS_SELECTOR, '[class*="sc-d233e5e8-0"]')
-            for elem in elements:
-                amount_text = elem.text.strip()
-                if amount_text:
-                    amount_match = re.search(r'\$[\d,]+', amount_text)
-                    if amount_match:
-                        return amount_match.group()
-                    return amount_text
-        except:
-            pass
+        amount_text = _first_text(page.soup, selectors)
         
         # Final fallback: old method
-        try:
-            amount_elem = driver.find_element(By.XPATH, "//*[contains(text(), '$')]")
-            amount_text = amount_elem.text.strip()
-            amount_match = re.search(r'\$[\d,]+', amount_text)
-            if amount_match:
-                return amount_match.group()
-            return amount_text if amount_text else None
-        except:
+        if not amount_text:
+            for elem in _elements_containing(page.text_nodes(), ('$',)):
+                amount_text = _element_text(elem)
+                break
+        
+        if not amount_text:
             return None
+        # Extract dollar amount if present
+        amount_match = _AMOUNT_RE.search(amount_text)
+        if amount_match:
+            return amount_match.group()
+        return amount_text
     
-    def _extract_dates(self, driver: webdriver.Chrome) -> Optional[Dict[str, str]]:
+    def _extract_dates(self, page: PageContext) -> Optional[Dict[str, str]]:
         """Extract opens and closes dates"""
         dates = {}
         try:
-            page_text = driver.find_element(By.TAG_NAME, "body").text
+            page_text = page.body_text
             
             # Try to find Opens date
-            opens_match = re.search(r'Opens:\s*(\d{1,2}/\d{1,2}/\d{4})', page_text)
+            opens_match = _OPENS_RE.search(page_text)
             if opens_match:
                 dates['opens'] = opens_match.group(1)
             else:
-                opens_elem = driver.find_elements(By.XPATH, "//*[contains(text(), 'Opens:')]")
-                if opens_elem:
-                    text = opens_elem[0].text.strip()
+                opens_elem = next(_elements_containing(page.text_nodes(), ('Opens:',)), None)
+                if opens_elem is not None:
+                    text = _element_text(opens_elem)
                     date_part = text.replace('Opens:', '').strip()
                     if date_part:
                         dates['opens'] = date_part
             
             # Try to find Closes date
-            closes_match = re.search(r'Closes:\s*(\d{1,2}/\d{1,2}/\d{4})', page_text)
+            closes_match = _CLOSES_RE.search(page_text)
             if closes_match:
                 dates['closes'] = closes_match.group(1)
             else:
-                closes_elem = driver.find_elements(By.XPATH, "//*[contains(text(), 'Closes:')]")
-                if closes_elem:
-                    text = closes_elem[0].text.strip()
+                closes_elem = next(_elements_containing(page.text_nodes(), ('Closes:',)), None)
+                if closes_elem is not None:
+                    text = _element_text(closes_elem)
                     date_part = text.replace('Closes:', '').strip()
                     if date_part:
                         dates['closes'] = date_part
@@ -422,18 +608,24 @@ class BigFutureScraper:
             print(f"Error extracting dates: {e}")
             return None
     
-    def _extract_description(self, driver: webdriver.Chrome) -> Optional[str]:
-        """Extract scholarship description"""
+    def _extract_description(self, page: PageContext) -> Optional[str]:
+        """
+        Extract scholarship description.
+        
+        The og:description meta tag holds the canonical description and is a
+        single lookup, so it is tried first; the body-text walk is the fallback.
+        """
         try:
-            page_text = driver.find_element(By.TAG_NAME, "body").text
-            lines = page_text.split('\n')
+            meta_desc = page.soup.select_one('meta[property="og:description"]')
+            if meta_desc is not None:
+                content = (meta_desc.get('content') or '').strip()
+                if content:
+                    return content
+            
+            lines = page.lines
             
             # Find "About the Scholarship" line
-            about_idx = None
-            for i, line in enumerate(lines):
-                if 'About the Scholarship' in line:
-                    about_idx = i
-                    break
+            about_idx = page.sections.get('About the Scholarship')
             
             if about_idx is not None:
                 # The description is usually the longer paragraph after the dates
@@ -447,38 +639,26 @@ class BigFutureScraper:
                         # If it's a longer sentence, it's likely the description
                         if len(line) > 50 and '.' in line:
                             return line
-            
-            # Fallback: try meta description
-            try:
-                meta_desc = driver.find_element(By.XPATH, "//meta[@property='og:description']")
-                return meta_desc.get_attribute('content')
-            except:
-                pass
         except Exception as e:
             print(f"Error extracting description: {e}")
         
         return None
     
-    def _extract_requirements(self, driver: webdriver.Chrome) -> Optional[List[str]]:
+    def _extract_requirements(self, page: PageContext) -> Optional[List[str]]:
         """Extract scholarship requirements"""
         requirements = []
         try:
-            page_text = driver.find_element(By.TAG_NAME, "body").text
-            lines = page_text.split('\n')
+            lines = page.lines
             
             # Find "Requirements" line
-            req_idx = None
-            for i, line in enumerate(lines):
-                if line.strip() == 'Requirements':
-                    req_idx = i
-                    break
+            req_idx = page.sections.get('Requirements')
             
             if req_idx is not None:
                 # Collect requirements until we hit "Details" or another section
                 for i in range(req_idx + 1, min(req_idx + 20, len(lines))):
                     line = lines[i].strip()
                     # Stop if we hit another major section
-                    if line in ['Details', 'Expand All', 'Collapse All', 'Pursued Degree Level', 'Next Steps']:
+                    if line in _REQ_STOP:
                         break
                     # Add non-empty lines that look like requirements
                     if line and len(line) > 3 and not line.startswith('*') and not line.startswith('•'):
@@ -486,13 +666,11 @@ class BigFutureScraper:
             
             # Also try to get from list items as backup
             if not requirements:
-                all_lis = driver.find_elements(By.TAG_NAME, "li")
-                for li in all_lis:
-                    text = li.text.strip()
+                for li in page.soup.find_all('li'):
+                    text = _element_text(li)
                     # Check if this li is likely a requirement
                     if text and 5 < len(text) < 200 and not text.startswith('http'):
-                        req_keywords = ['Resident', 'Attend', 'Student', 'Seeking', 'Studying', 'Degree', 'Grade']
-                        if any(keyword in text for keyword in req_keywords):
+                        if _REQ_KEYWORD_RE.search(text):
                             requirements.append(text)
             
             # Remove duplicates
@@ -502,7 +680,7 @@ class BigFutureScraper:
             print(f"Error extracting requirements: {e}")
             return None
     
-    def _extract_details(self, driver: webdriver.Chrome) -> Optional[Dict[str, str]]:
+    def _extract_details(self, page: PageContext) -> Optional[Dict[str, str]]:
         """
         Extract structured details section from accordion structure.
         Each field is in div.cb-accordion-container:
@@ -513,88 +691,65 @@ class BigFutureScraper:
         details = {}
         try:
             # Find all accordion containers
-            accordion_containers = driver.find_elements(By.CSS_SELECTOR, 'div.cb-accordion-container')
+            accordion_containers = page.soup.select('div.cb-accordion-container')
             
             if not accordion_containers:
                 # Fallback to old method if accordion structure not found
-                return self._extract_details_fallback(driver)
-            
-            # Keywords that indicate location information
-            location_keywords = ['Country', 'State', 'County', 'City', 'Region', 'Zip', 'Postal']
-            # Keywords that indicate NON-location fields (should be excluded from location)
-            non_location_keywords = ['GPA', 'Activities', 'Community Service', 'Extracurricular', 
-                                    'Leadership', 'Affiliations', 'ROTC', 'Essay', 'Merit', 'Need']
+                return self._extract_details_fallback(page)
             
             for container in accordion_containers:
-                try:
-                    # Get field name from cb-accordion-heading-title (span inside it)
-                    heading_elem = container.find_element(By.CSS_SELECTOR, 'div.cb-accordion-heading-title')
-                    span_in_heading = heading_elem.find_elements(By.TAG_NAME, 'span')
-                    if span_in_heading:
-                        field_name = span_in_heading[0].text.strip()
+                # Get field name from cb-accordion-heading-title (span inside it)
+                heading_elem = container.select_one('div.cb-accordion-heading-title')
+                if heading_elem is None:
+                    continue
+                span_in_heading = heading_elem.find('span')
+                field_name = _element_text(span_in_heading or heading_elem)
+                
+                if not field_name:
+                    continue
+                
+                # Get field value from span.sc-2872267-3 in cb-accordion-panel-content
+                panel_content = container.select_one('div.cb-accordion-panel-content')
+                if panel_content is None:
+                    continue
+                
+                # Collect all values from spans
+                values = []
+                for span in panel_content.select('span.sc-2872267-3'):
+                    value_text = _element_text(span)
+                    if value_text:
+                        values.append(value_text)
+                
+                if values:
+                    field_value = ', '.join(values)
+                else:
+                    # Fallback: get all text from panel content
+                    field_value = '\n'.join(panel_content.stripped_strings)
+                
+                if not field_value:
+                    continue
+                
+                # Normalize field name (lowercase, replace spaces with underscores)
+                normalized_name = field_name.lower().replace(' ', '_')
+                
+                # For Location field, extract structured data from UL list
+                if normalized_name == 'location':
+                    location_structure = self._extract_location_structure(panel_content)
+                    if location_structure:
+                        details[normalized_name] = location_structure
                     else:
-                        field_name = heading_elem.text.strip()
-                    
-                    if not field_name:
-                        continue
-                    
-                    # Get field value from span.sc-2872267-3 in cb-accordion-panel-content
-                    try:
-                        panel_content = container.find_element(By.CSS_SELECTOR, 'div.cb-accordion-panel-content')
-                        value_spans = panel_content.find_elements(By.CSS_SELECTOR, 'span.sc-2872267-3')
-                        
-                        if value_spans:
-                            # Collect all values from spans
-                            values = []
-                            for span in value_spans:
-                                value_text = span.text.strip()
-                                if value_text:
-                                    values.append(value_text)
-                            
-                            if values:
-                                field_value = ', '.join(values)
-                            else:
-                                # Fallback: get all text from panel content
-                                field_value = panel_content.text.strip()
-                        else:
-                            # Fallback: get all text from panel content
-                            field_value = panel_content.text.strip()
-                    except:
-                        # If panel content not found, try to get value from container
-                        try:
-                            panel_content = container.find_element(By.CSS_SELECTOR, 'div.cb-accordion-panel-content')
-                            field_value = panel_content.text.strip()
-                        except:
-                            continue
-                    
-                    if not field_value:
-                        continue
-                    
-                    # Normalize field name (lowercase, replace spaces with underscores)
-                    normalized_name = field_name.lower().replace(' ', '_')
-                    
-                    # For Location field, extract structured data from UL list
-                    if normalized_name == 'location':
-                        location_structure = self._extract_location_structure(panel_content)
+                        # Fallback: parse from string if UL not found
+                        location_structure = self._parse_location_string(field_value)
                         if location_structure:
                             details[normalized_name] = location_structure
-                        else:
-                            # Fallback: parse from string if UL not found
-                            location_structure = self._parse_location_string(field_value)
-                            if location_structure:
-                                details[normalized_name] = location_structure
-                    else:
-                        details[normalized_name] = field_value
-                        
-                except Exception as e:
-                    # Skip this container if there's an error
-                    continue
+                else:
+                    details[normalized_name] = field_value
             
             return details if details else None
         except Exception as e:
             print(f"Error extracting details from accordion: {e}")
             # Fallback to old method
-            return self._extract_details_fallback(driver)
+            return self._extract_details_fallback(page)
     
     def _extract_location_structure(self, panel_content) -> Optional[Dict[str, str]]:
         """
@@ -603,30 +758,27 @@ class BigFutureScraper:
         Each li has class sc-2872267-2, format: "Field: Value"
         """
         location_dict = {}
-        try:
-            # Find UL with class eligibility-criteria-locations-list-item-id
-            location_ul = panel_content.find_element(By.CSS_SELECTOR, 'ul.eligibility-criteria-locations-list-item-id')
-            
-            # Find all li elements with class sc-2872267-2
-            location_items = location_ul.find_elements(By.CSS_SELECTOR, 'li.sc-2872267-2')
-            
-            for item in location_items:
-                text = item.text.strip()
-                if ':' in text:
-                    # Split by ':' to get field and value
-                    parts = text.split(':', 1)  # Split only on first ':'
-                    if len(parts) == 2:
-                        field = parts[0].strip()
-                        value = parts[1].strip()
-                        if field and value:
-                            # Normalize field name (lowercase, replace spaces with underscores)
-                            normalized_field = field.lower().replace(' ', '_')
-                            location_dict[normalized_field] = value
-            
-            return location_dict if location_dict else None
-        except:
+        # Find UL with class eligibility-criteria-locations-list-item-id
+        location_ul = panel_content.select_one('ul.eligibility-criteria-locations-list-item-id')
+        if location_ul is None:
             # UL not found or structure different
             return None
+        
+        # Find all li elements with class sc-2872267-2
+        for item in location_ul.select('li.sc-2872267-2'):
+            text = _element_text(item)
+            if ':' in text:
+                # Split by ':' to get field and value
+                parts = text.split(':', 1)  # Split only on first ':'
+                if len(parts) == 2:
+                    field = parts[0].strip()
+                    value = parts[1].strip()
+                    if field and value:
+                        # Normalize field name (lowercase, replace spaces with underscores)
+                        normalized_field = field.lower().replace(' ', '_')
+                        location_dict[normalized_field] = value
+        
+        return location_dict if location_dict else None
     
     def _parse_location_string(self, location_string: str) -> Optional[Dict[str, str]]:
         """
@@ -673,67 +825,51 @@ class BigFutureScraper:
             print(f"Error parsing location string: {e}")
             return None
     
-    def _extract_details_fallback(self, driver: webdriver.Chrome) -> Optional[Dict[str, str]]:
+    def _extract_details_fallback(self, page: PageContext) -> Optional[Dict[str, str]]:
         """Fallback method to extract details from page text if accordion structure not found"""
         details = {}
         try:
-            page_text = driver.find_element(By.TAG_NAME, "body").text
-            lines = page_text.split('\n')
+            lines = page.lines
             
             # Find "Details" section
-            details_start_idx = None
-            for i, line in enumerate(lines):
-                if line.strip() == 'Details':
-                    details_start_idx = i
-                    break
+            details_start_idx = page.sections.get('Details')
             
             if details_start_idx is not None:
                 current_category = None
                 current_values = []
-                
-                # Keywords that indicate location information
-                location_keywords = ['Country', 'State', 'County', 'City', 'Region', 'Zip', 'Postal']
-                # Keywords that indicate NON-location fields (should be excluded from location)
-                non_location_keywords = ['GPA', 'Activities', 'Community Service', 'Extracurricular', 
-                                        'Leadership', 'Affiliations', 'ROTC', 'Essay', 'Merit', 'Need']
+
                 
                 for i in range(details_start_idx + 1, min(details_start_idx + 50, len(lines))):
                     line = lines[i].strip()
                     
                     # Stop if we hit "Next Steps" or other major sections
-                    if line in ['Next Steps', 'Match With Scholarships', 'See All Scholarships']:
+                    if line in _DETAILS_STOP:
                         break
                     
                     # Skip control buttons
-                    if line in ['Expand All', 'Collapse All']:
+                    if line in _ACCORDION_CONTROLS:
                         continue
                     
                     # Check if this line is a category header
-                    category_headers = ['Pursued Degree Level', 'Current Grade', 'Location', 
-                                       'Current School', 'Intended Area of Study']
-                    is_category = False
-                    for header in category_headers:
-                        if line == header:
-                            # Save previous category if any
-                            if current_category and current_values:
-                                details[current_category.lower().replace(' ', '_')] = ', '.join(current_values)
-                            current_category = header
-                            current_values = []
-                            is_category = True
-                            break
+                    is_category = line in _CATEGORY_HEADERS
+                    if is_category:
+                        # Save previous category if any
+                        if current_category and current_values:
+                            details[current_category.lower().replace(' ', '_')] = ', '.join(current_values)
+                        current_category = line
+                        current_values = []
                     
                     # If not a category header and we have a current category, collect values
                     if not is_category and current_category and line:
                         # For Location category, only include location-related values
                         if current_category == 'Location':
                             # Only add if it contains location keywords and NOT non-location keywords
-                            if (any(kw in line for kw in location_keywords) and 
-                                not any(kw in line for kw in non_location_keywords)):
+                            if _is_location_line(line):
                                 if len(line) > 2:
                                     current_values.append(line)
                         else:
                             # For other categories, add if it looks like a value
-                            if line not in ['Country:', 'State:'] and not any(h in line for h in category_headers):
+                            if line not in ('Country:', 'State:') and not _CATEGORY_HEADER_RE.search(line):
                                 if len(line) > 2:
                                     current_values.append(line)
                 
@@ -746,50 +882,58 @@ class BigFutureScraper:
             print(f"Error extracting details (fallback): {e}")
             return None
     
-    def _extract_flags(self, driver: webdriver.Chrome) -> Optional[Dict[str, str]]:
+    def _extract_flags(self, page: PageContext) -> Optional[Dict[str, str]]:
         """Extract essay/need/merit flags"""
         flags = {}
-        try:
-            flag_texts = driver.find_elements(By.XPATH, 
-                "//*[contains(text(), 'Essay Required') or contains(text(), 'Need-Based') or contains(text(), 'Merit-Based')]")
-            for elem in flag_texts:
-                text = elem.text.strip()
-                if 'Essay Required' in text:
-                    flags['essay_required'] = 'Yes' if 'Yes' in text else 'No'
-                if 'Need-Based' in text:
-                    flags['need_based'] = 'Yes' if 'Yes' in text else 'No'
-                if 'Merit-Based' in text:
-                    flags['merit_based'] = 'Yes' if 'Yes' in text else 'No'
-            return flags if flags else None
-        except:
-            return None
+        for elem in _elements_containing(page.text_nodes(), _FLAG_NEEDLES):
+            text = _element_text(elem)
+            value = 'Yes' if 'Yes' in text else 'No'
+            # One regex scan finds every flag label in the element
+            for label in _FLAG_RE.findall(text):
+                flags[_FLAG_KEYS[label]] = value
+        return flags if flags else None
     
-    def _extract_urls(self, driver: webdriver.Chrome) -> Dict[str, Optional[str]]:
-        """Extract external and application URLs"""
+    def _extract_urls(self, page: PageContext, page_url: str) -> Dict[str, Optional[str]]:
+        """
+        Extract external and application URLs.
+        
+        hrefs in the snapshot are as authored, so they are resolved against
+        page_url the way the browser would.
+        """
         urls = {'external_url': None, 'application_url': None}
         try:
-            # Look for "Website" link first
-            website_link = driver.find_elements(By.XPATH, "//a[contains(text(), 'Website')]")
-            if website_link:
-                external_url = website_link[0].get_attribute('href')
+            # One scan finds the "Website" link (preferred) and the first
+            # "Apply Now" button, instead of a scan per lookup
+            website_link = None
+            apply_btn = None
+            for string in page.text_nodes():
+                parent = string.parent
+                if parent.name == 'a' and any(needle in string for needle in _WEBSITE_NEEDLES):
+                    website_link = parent
+                    break
+                if (apply_btn is None and parent.name == 'button' and
+                        any(needle in string for needle in _APPLY_NEEDLES)):
+                    apply_btn = parent
+            
+            if website_link is not None:
+                external_url = website_link.get('href')
                 if external_url:
-                    urls['external_url'] = external_url
-                    urls['application_url'] = external_url
+                    urls['external_url'] = urljoin(page_url, external_url)
+                    urls['application_url'] = urls['external_url']
             else:
-                # Try to find "Apply Now" button
-                apply_btn = driver.find_elements(By.XPATH, "//button[contains(text(), 'Apply Now')]")
-                if apply_btn:
-                    try:
-                        parent_link = apply_btn[0].find_element(By.XPATH, "./ancestor::a[1]")
-                        external_url = parent_link.get_attribute('href')
+                # Try the "Apply Now" button
+                if apply_btn is not None:
+                    parent_link = apply_btn.find_parent('a')
+                    if parent_link is not None:
+                        external_url = parent_link.get('href')
                         if external_url:
-                            urls['external_url'] = external_url
-                            urls['application_url'] = external_url
-                    except:
-                        onclick = apply_btn[0].get_attribute('onclick')
-                        data_url = apply_btn[0].get_attribute('data-url') or apply_btn[0].get_attribute('data-href')
+                            urls['external_url'] = urljoin(page_url, external_url)
+                            urls['application_url'] = urls['external_url']
+                    else:
+                        onclick = apply_btn.get('onclick')
+                        data_url = apply_btn.get('data-url') or apply_btn.get('data-href')
                         if onclick and 'http' in onclick:
-                            url_match = re.search(r'https?://[^\s\'\"\)]+', onclick)
+                            url_match = _ONCLICK_URL_RE.search(onclick)
                             if url_match:
                                 urls['external_url'] = url_match.group()
                                 urls['application_url'] = url_match.group()
@@ -801,31 +945,56 @@ class BigFutureScraper:
         
         return urls
     
-    def _check_page_exists(self, driver: webdriver.Chrome) -> bool:
+    def _check_page_exists(self, soup: BeautifulSoup) -> bool:
         """
         Check if the page exists by looking for error banner.
         
         Returns:
             True if page exists, False if error banner is found
         """
-        try:
-            # Look for error banner with class "errorBannerTitle"
-            error_banner = driver.find_elements(By.CSS_SELECTOR, 'div.errorBannerTitle')
-            if error_banner:
-                error_text = error_banner[0].text.strip()
-                if "Sorry, the page doesn't exist" in error_text:
-                    return False
-            return True
-        except:
-            # If we can't check, assume page exists
-            return True
-    
-    def scrape(self, url: str) -> Optional[Dict[str, Any]]:
+        # Look for error banner with class "errorBannerTitle"
+        error_banner = soup.select_one(_ERROR_BANNER_CSS)
+        if error_banner is not None:
+            if "Sorry, the page doesn't exist" in _element_text(error_banner):
+                return False
+        return True
+    
+    def _extract_all(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+        """Run every extractor against a parsed page (rendered or raw HTML)"""
+        # Body text and section headings are computed once, shared by all extractors
+        page = PageContext.from_soup(soup)
+        scholarship_data = {
+            'name': self._extract_name(page),
+            'foundation': self._extract_foundation(page),
+            'status': self._extract_status(page),
+            'amount': self._extract_amount(page),
+            'dates': self._extract_dates(page),
+            'description': self._extract_description(page),
+            'requirements': self._extract_requirements(page),
+            'details': self._extract_details(page),
+            'flags': self._extract_flags(page),
+            'url': url,
+        }
+        
+        # Add external URLs
+        urls = self._extract_urls(page, url)
+        scholarship_data.update(urls)
+        
+        return scholarship_data
+    
+    def scrape(self, url: str, force: bool = False) -> Optional[Dict[str, Any]]:
         """
         Main method to scrape a scholarship page
         
+        With a cache configured, data stored within cache_max_age is returned
+        as is; otherwise a HEAD request runs first and a page whose
+        ETag/Last-Modified is unchanged returns the stored data without
+        starting the browser.
+        
         Args:
             url: The URL of the scholarship page
+            force: Ignore cached data and scrape the page (the result is
+                still cached)
             
         Returns:
             Dictionary containing scholarship data, or None if scraping failed
@@ -833,41 +1002,67 @@ class BigFutureScraper:
         Raises:
             PageNotFoundError: If the page doesn't exist (error banner found)
         """
-        driver = None
+        if not force:
+            fresh = self._fresh_cached(url)
+            if fresh:
+                print(f"Scraped recently, using cached data: {url}")
+                return fresh
+        
+        head = None
+        if self.cache:
+            try:
+                # Still needed when forced: the validators are cached with the result
+                head = self.session.head(url, timeout=10, allow_redirects=True)
+                cached = None if force else self.cache.get_unchanged(
+                    url, etag=head.headers.get('ETag'), last_modified=head.headers.get('Last-Modified'))
+                if cached:
+                    print(f"Page unchanged since last scrape, using cached data: {url}")
+                    return cached
+            except requests.RequestException:
+                head = None
+        
+        scholarship_data = self._scrape_rendered(url)
+        if scholarship_data:
+            # Without a HEAD response (or its validators) the entry still
+            # serves get_fresh() within cache_max_age
+            self._cache_page(url, head.headers if head is not None else {}, scholarship_data)
+        return scholarship_data
+    
+    def _scrape_rendered(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Render the page in the shared Chrome and extract its data.
+        
+        Raises:
+            PageNotFoundError: If the page doesn't exist (error banner found)
+        """
         try:
             print(f"Fetching scholarship page: {url}")
-            driver = self._setup_driver()
+            driver = self._get_driver()
             driver.get(url)
             
-            # Wait for page to load
-            time.sleep(3)
+            # Wait once for the page to render; the extractors then read a
+            # snapshot and never wait themselves
+            try:
+                WebDriverWait(driver, 10, poll_frequency=_PAGE_READY_POLL).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, _PAGE_READY_CSS))
+                )
+            except TimeoutException:
+                print("  Page did not finish rendering in time, extracting what is there...")
+            
+            # Extract all data from one snapshot of the rendered page
+            soup = self._snapshot(driver)
             
             # Check if page exists before proceeding
-            if not self._check_page_exists(driver):
+            if not self._check_page_exists(soup):
                 raise PageNotFoundError(f"Page not found: {url}")
             
-            # Expand all sections
-            self._expand_all_sections(driver)
-            
-            # Extract all data
-            scholarship_data = {
-                'name': self._extract_name(driver),
-                'foundation': self._extract_foundation(driver),
-                'status': self._extract_status(driver),
-                'amount': self._extract_amount(driver),
-                'dates': self._extract_dates(driver),
-                'description': self._extract_description(driver),
-                'requirements': self._extract_requirements(driver),
-                'details': self._extract_details(driver),
-                'flags': self._extract_flags(driver),
-                'url': url,
-            }
-            
-            # Add external URLs
-            urls = self._extract_urls(driver)
-            scholarship_data.update(urls)
+            # Collapsed accordion panels are only CSS-hidden, so the snapshot
+            # can read them as is; expand only if their content isn't mounted
+            if self._has_unrendered_panels(soup):
+                self._expand_all_sections(driver)
+                soup = self._snapshot(driver)
             
-            return scholarship_data
+            return self._extract_all(soup, url)
             
         except PageNotFoundError:
             # Re-raise PageNotFoundError so caller can handle it specially
@@ -876,23 +1071,238 @@ class BigFutureScraper:
             print(f"Error scraping with Selenium: {e}")
             import traceback
             traceback.print_exc()
+            # The browser may be in a bad state; start a fresh one next time
+            self.close()
             return None
-        finally:
-            if driver:
-                driver.quit()
     
-    def scrape_scholarship(self, url: str, use_selenium: bool = True) -> Optional[Dict[str, Any]]:
+    def _scrape_static(self, html: str, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract scholarship data from server-rendered HTML.
+        
+        Returns None if the name or details are missing, i.e. the page
+        needs JavaScript to render.
+        
+        Raises:
+            PageNotFoundError: If the page doesn't exist (error banner found)
+        """
+        soup = BeautifulSoup(html, 'lxml')
+        if not self._check_page_exists(soup):
+            raise PageNotFoundError(f"Page not found: {url}")
+        
+        scholarship_data = self._extract_all(soup, url)
+        if scholarship_data['name'] and scholarship_data['details']:
+            return scholarship_data
+        return None
+    
+    def scrape_fast(self, url: str, force: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Scrape a scholarship page over plain HTTP, falling back to Selenium.
+        
+        The server-rendered HTML is parsed with the same extractors as the
+        Selenium snapshot. Chrome is only started when the static page is
+        missing the name or details (i.e. the content needs JavaScript).
+        With a cache configured, data stored within cache_max_age is returned
+        without a request, and an unchanged page (304) returns the stored
+        data without parsing anything; force=True bypasses both.
+        
+        Raises:
+            PageNotFoundError: If the page doesn't exist (error banner found)
+        """
+        if not force:
+            fresh = self._fresh_cached(url)
+            if fresh:
+                print(f"Scraped recently, using cached data: {url}")
+                return fresh
+        
+        page_fingerprint = None
+        try:
+            print(f"Fetching scholarship page over HTTP: {url}")
+            headers = self.cache.conditional_headers(url) if self.cache and not force else None
+            response = self.session.get(url, headers=headers, timeout=30)
+            if response.status_code == 304:
+                cached = self.cache.get(url)
+                if cached:
+                    print("  Page unchanged since last scrape, using cached data")
+                    return cached
+            response.raise_for_status()
+            if self.cache:
+                # Servers without validators still send the same bytes
+                page_fingerprint = fingerprint(response.content)
+                cached = None if force else self.cache.get_unchanged(url, page_fingerprint=page_fingerprint)
+                if cached:
+                    print("  Page content unchanged since last scrape, using cached data")
+                    return cached
+            scholarship_data = self._scrape_static(response.text, url)
+            if scholarship_data:
+                self._cache_page(url, response.headers, scholarship_data, page_fingerprint)
+                return scholarship_data
+            print("  Static HTML is incomplete, rendering with Selenium...")
+        except PageNotFoundError:
+            raise
+        except Exception as e:
+            print(f"  HTTP fetch failed ({e}), rendering with Selenium...")
+        
+        # Not cached under the static response's validators/fingerprint: they
+        # stay the same when only the JavaScript-loaded content changes
+        scholarship_data = self._scrape_rendered(url)
+        if scholarship_data:
+            self._cache_page(url, {}, scholarship_data)
+        return scholarship_data
+    
+    def _fresh_cached(self, url: str) -> Optional[Dict[str, Any]]:
+        """Cached data for url stored within cache_max_age seconds, if any"""
+        if self.cache and self.cache_max_age is not None:
+            return self.cache.get_fresh(url, self.cache_max_age)
+        return None
+    
+    def _cache_page(self, url: str, headers, scholarship_data: Dict[str, Any],
+                    page_fingerprint: Optional[str] = None) -> None:
+        """Store scholarship data under the validators/fingerprint of the response it came from"""
+        if self.cache:
+            self.cache.store(url, headers.get('ETag'), headers.get('Last-Modified'),
+                             scholarship_data, page_fingerprint)
+    
+    async def scrape_many_async(self, urls: List[str], concurrency: int = 32,
+                                parse_workers: Optional[int] = None) -> List[Optional[Dict[str, Any]]]:
+        """
+        Scrape many scholarship pages concurrently over HTTP.
+        
+        Downloads overlap on one aiohttp session, bounded by a semaphore of
+        `concurrency` requests. Parsing is CPU-bound, so pages are parsed in
+        a pool of `parse_workers` processes (default: one per CPU) while the
+        event loop keeps downloading. Pages that need JavaScript are then
+        rendered with Selenium one at a time.
+        
+        Usage: asyncio.run(scraper.scrape_many_async(urls))
+        (on spawn-based platforms, call it under `if __name__ == '__main__':`).
+        The event loop is the caller's: with uvloop installed, run it with
+        uvloop.run(scraper.scrape_many_async(urls)) instead.
+        
+        Returns:
+            Scholarship data in the same order as urls; None for pages that
+            don't exist or failed to scrape
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            print("aiohttp not available. Install it with: pip install aiohttp")
+            print("Scraping sequentially instead...")
+            return [self._scrape_or_none(url) for url in urls]
+        
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.BoundedSemaphore(concurrency)
+        
+        async def fetch(session, url):
+            fresh = self._fresh_cached(url)
+            if fresh:
+                return fresh
+            headers = self.cache.conditional_headers(url) if self.cache else None
+            async with semaphore:
+                try:
+                    async with session.get(url, headers=headers) as response:
+                        if response.status == 304:
+                            cached = self.cache.get(url)
+                            if cached:
+                                return cached
+                        response.raise_for_status()
+                        body = await response.read()
+                        # Decoded from the bytes already read; undecodable
+                        # bytes become U+FFFD instead of failing the batch
+                        try:
+                            encoding = response.get_encoding()
+                            html = body.decode(encoding, errors='replace')
+                        except (LookupError, RuntimeError):
+                            # Unknown or undetectable charset
+                            html = body.decode('utf-8', errors='replace')
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    print(f"  HTTP fetch failed for {url} ({e})")
+                    return None
+            page_fingerprint = None
+            if self.cache:
+                page_fingerprint = fingerprint(body)
+                cached = self.cache.get_unchanged(url, page_fingerprint=page_fingerprint)
+                if cached:
+                    return cached
+            try:
+                scholarship_data = await loop.run_in_executor(parse_pool, _parse_html, html, url)
+            except PageNotFoundError as e:
+                print(f"  {e}")
+                return _PAGE_NOT_FOUND
+            except Exception as e:
+                # Left to the Selenium fallback rather than failing the batch
+                print(f"  Parsing failed for {url} ({e})")
+                return None
+            if scholarship_data:
+                self._cache_page(url, response.headers, scholarship_data, page_fingerprint)
+            return scholarship_data
+        
+        # Same browser headers as self.session, except Accept-Encoding: aiohttp
+        # advertises only the encodings it can actually decode
+        headers = {key: value for key, value in self.session.headers.items()
+                   if key.lower() != 'accept-encoding'}
+        connector = aiohttp.TCPConnector(limit_per_host=16)
+        timeout = aiohttp.ClientTimeout(total=30)
+        with ProcessPoolExecutor(max_workers=parse_workers) as parse_pool:
+            async with aiohttp.ClientSession(headers=headers, connector=connector,
+                                             timeout=timeout) as session:
+                fetched = await asyncio.gather(*(fetch(session, url) for url in urls))
+        
+        results = []
+        for url, scholarship_data in zip(urls, fetched):
+            if scholarship_data is _PAGE_NOT_FOUND:
+                results.append(None)
+            elif scholarship_data is None:
+                results.append(self._scrape_or_none(url))
+            else:
+                results.append(scholarship_data)
+        return results
+    
+    def _scrape_or_none(self, url: str) -> Optional[Dict[str, Any]]:
+        """scrape_fast() for batch use: a missing page yields None instead of raising"""
+        try:
+            return self.scrape_fast(url)
+        except PageNotFoundError as e:
+            print(f"  {e}")
+            return None
+    
+    def scrape_many(self, urls: List[str], workers: int = 8) -> List[Optional[Dict[str, Any]]]:
+        """
+        Render many scholarship pages in parallel with `workers` browsers.
+        
+        The browsers are started together up front and each thread reuses
+        one for all of its pages; they are quit when the batch is done.
+        Pool members share this scraper's page cache, if any, and its
+        remote_url: with a Selenium Grid, workers can match the grid's
+        session capacity rather than local memory.
+        
+        Returns:
+            Scholarship data in the same order as urls; None for pages that
+            don't exist or failed to scrape
+        """
+        with ScraperPool(n=workers, remote_url=self.remote_url) as pool:
+            for scraper in pool.scrapers.queue:
+                scraper.cache = self.cache
+                scraper.cache_max_age = self.cache_max_age
+            pool.start()
+            return pool.map(urls)
+    
+    def scrape_scholarship(self, url: str, use_selenium: bool = True,
+                           force: bool = False) -> Optional[Dict[str, Any]]:
         """
         Backward compatibility method - calls scrape()
         
         Args:
             url: The URL of the scholarship page
-            use_selenium: Whether to use Selenium (always True for BigFuture)
+            use_selenium: Always render with Selenium; if False, try a plain
+                HTTP fetch first (scrape_fast)
+            force: Bypass the page cache
             
         Returns:
             Dictionary containing scholarship data, or None if scraping failed
         """
-        return self.scrape(url)
+        if not use_selenium:
+            return self.scrape_fast(url, force=force)
+        return self.scrape(url, force=force)
     
     def save_to_json(self, scholarship_data: Dict[str, Any], filename: Optional[str] = None) -> str:
         """Save scholarship data to JSON file"""
@@ -902,7 +1312,7 @@ class BigFutureScraper:
         if filename is None:
             # Generate filename from scholarship name or URL
             if scholarship_data.get('name'):
-                filename = re.sub(r'[^\w\s-]', '', scholarship_data['name']).strip().replace(' ', '_') + '.json'
+                filename = _FILENAME_UNSAFE_RE.sub('', scholarship_data['name']).strip().replace(' ', '_') + '.json'
             else:
                 url_parts = scholarship_data.get('url', '').split('/')
                 filename = url_parts[-1] + '.json' if url_parts else 'scholarship.json'
@@ -911,13 +1321,106 @@ class BigFutureScraper:
             filename += '.json'
         
         print(f"Saving scholarship data to {filename}...")
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(scholarship_data, f, indent=2, ensure_ascii=False)
+        write_json(scholarship_data, filename)
         
         print(f"✓ Successfully saved to {filename}")
         return filename
 
 
+def write_json(data: Any, path) -> None:
+    """
+    Write data as indented UTF-8 JSON (non-ASCII kept as is), with orjson
+    when it is installed; orjson produces the UTF-8 bytes directly.
+    """
+    if orjson is None:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    else:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+
+
+def _browser_limit() -> Optional[int]:
+    """How many headless Chromes fit in half of physical memory; None if unknown"""
+    try:
+        total = os.sysconf('SC_PHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        # No sysconf (Windows) or the value isn't available
+        return None
+    return max(1, total // 2 // _BROWSER_MEMORY)
+
+
+class ScraperPool:
+    """
+    Scrape pages in parallel with N scrapers, each keeping its own Chrome.
+    
+    Usage:
+        with ScraperPool(n=4) as pool:
+            results = pool.map(urls)
+    """
+    
+    def __init__(self, n: int = 4, **scraper_kwargs):
+        # Remote browsers don't use this machine's memory
+        limit = None if scraper_kwargs.get('remote_url') else _browser_limit()
+        if limit is not None and n > limit:
+            print(f"  Only enough memory for {limit} browsers; using {limit} instead of {n}")
+            n = limit
+        self.n = n
+        self.scrapers = queue.Queue()
+        for _ in range(n):
+            self.scrapers.put(BigFutureScraper(**scraper_kwargs))
+    
+    def _scrape(self, url: str) -> Optional[Dict[str, Any]]:
+        """Borrow a scraper (and its browser) for one page"""
+        scraper = self.scrapers.get()
+        try:
+            return scraper.scrape(url)
+        except PageNotFoundError as e:
+            print(f"  {e}")
+            return None
+        finally:
+            self.scrapers.put(scraper)
+    
+    def start(self) -> None:
+        """Launch every pool member's Chrome now, in parallel, instead of on first use"""
+        with ThreadPoolExecutor(max_workers=self.n) as executor:
+            list(executor.map(BigFutureScraper._get_driver, list(self.scrapers.queue)))
+    
+    def map(self, urls: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Scrape urls across the pool; results are in the same order, None on failure"""
+        with ThreadPoolExecutor(max_workers=self.n) as executor:
+            return list(executor.map(self._scrape, urls))
+    
+    def close(self) -> None:
+        """Quit every browser in the pool"""
+        while True:
+            try:
+                self.scrapers.get_nowait().close()
+            except queue.Empty:
+                break
+    
+    def __enter__(self) -> 'ScraperPool':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+# Scraper used by _parse_html, created once per worker process
+_worker_scraper = None
+
+
+def _parse_html(html: str, url: str) -> Optional[Dict[str, Any]]:
+    """
+    Module-level (picklable) form of BigFutureScraper._scrape_static for
+    parsing in worker processes.
+    """
+    global _worker_scraper
+    if _worker_scraper is None:
+        _worker_scraper = BigFutureScraper()
+    return _worker_scraper._scrape_static(html, url)
+
+
 # Backward compatibility alias
 ScholarshipDetailScraper = BigFutureScraper
 
@@ -930,8 +1433,8 @@ if __name__ == '__main__':
     if len(sys.argv) > 1:
         test_url = sys.argv[1]
     
-    scraper = BigFutureScraper()
-    data = scraper.scrape(test_url)
+    with BigFutureScraper() as scraper:
+        data = scraper.scrape(test_url)
     
     if data:
         print("\nScraped Data:")
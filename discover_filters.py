@@ -5,11 +5,18 @@ Analyzes all scholarships to identify filterable fields and their possible value
 """
 
 import json
+import multiprocessing as mp
 import os
 from pathlib import Path
 from collections import defaultdict, Counter
-from typing import Any, Dict, Set, List, Optional
+from typing import Any, DefaultDict, Dict, Set, List, Optional
 import re
+from functools import lru_cache
+
+# The same GPA and comma-separated strings recur across thousands of files
+_GPA_RE = re.compile(r'(\d+\.?\d*)')
+# A comma plus the whitespace around it, so splitting also strips the parts
+_CSV_RE = re.compile(r'\s*,\s*')
 
 
 def extract_numeric_gpa(value: Any) -> Optional[float]:
@@ -19,23 +26,18 @@ def extract_numeric_gpa(value: Any) -> Optional[float]:
     if isinstance(value, (int, float)):
         return float(value)
     if isinstance(value, str):
-        # Try to extract number from string like "3.0", "3.00", "Minimum 3.0 GPA", etc.
-        match = re.search(r'(\d+\.?\d*)', value)
-        if match:
-            return float(match.group(1))
+        return _gpa_from_string(value)
     return None
 
 
-def flatten_dict(d: Dict, parent_key: str = '', sep: str = '.') -> Dict[str, Any]:
-    """Flatten a nested dictionary."""
-    items = []
-    for k, v in d.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-        if isinstance(v, dict):
-            items.extend(flatten_dict(v, new_key, sep=sep).items())
-        else:
-            items.append((new_key, v))
-    return dict(items)
+@lru_cache(maxsize=4096)
+def _gpa_from_string(value: str) -> Optional[float]:
+    """Numeric GPA in a string (memoized)."""
+    # Try to extract number from string like "3.0", "3.00", "Minimum 3.0 GPA", etc.
+    match = _GPA_RE.search(value)
+    if match:
+        return float(match.group(1))
+    return None
 
 
 def parse_comma_separated(value: Any) -> List[str]:
@@ -45,62 +47,123 @@ def parse_comma_separated(value: Any) -> List[str]:
     if isinstance(value, list):
         return [str(v).strip() for v in value]
     if isinstance(value, str):
-        # Split by comma and clean up
-        return [v.strip() for v in value.split(',') if v.strip()]
+        return list(_split_comma_separated(value))
     return [str(value).strip()]
 
 
-def analyze_scholarship(file_path: Path, filters: Dict[str, Set[str]], 
-                       field_counts: Dict[str, int], 
-                       gpa_values: List[float],
-                       numeric_fields: Dict[str, List[float]]) -> bool:
-    """Analyze a single scholarship JSON file."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+@lru_cache(maxsize=4096)
+def _split_comma_separated(value: str) -> tuple:
+    """Split a comma-separated string into stripped, non-empty parts (memoized)."""
+    # Split by comma and clean up in one pass
+    return tuple(v for v in _CSV_RE.split(value.strip()) if v)
+
+
+# Top-level fields that are never filters
+_SKIP_FIELDS = frozenset({'name', 'description', 'requirements', 'url', 'external_url',
+                          'application_url', 'foundation', 'status', 'amount',
+                          'dates.opens', 'dates.closes'})
+# Focus on filterable fields - especially in details, flags, and location
+_FILTERABLE_PREFIXES = ('details', 'flags', 'location')
+_GPA_FIELDS = frozenset({'minimum_gpa', 'details.minimum_gpa'})
+_EMPTY_VALUES = frozenset({'None', 'null', 'N/A', ''})
+
+
+# Resolve the JSON codec once per process, not per file
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json(file_path: Path) -> Any:
+    """Parse a JSON file, with orjson when it is installed."""
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    if orjson is None:
+        return json.loads(raw)
+    return orjson.loads(raw)
+
+
+def dump_json(obj: Any, file_path: Path) -> None:
+    """Write obj as indented UTF-8 JSON, with orjson when it is installed."""
+    if orjson is None:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
+        return
+    with open(file_path, 'wb') as f:
+        # NON_STR_KEYS: the GPA counts are keyed by float
+        f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+
+
+@lru_cache(maxsize=None)
+def _field_kind(key: str) -> Optional[bool]:
+    """
+    None if the dotted key is not a filter field, otherwise whether it holds
+    a GPA. The same few hundred keys recur in every file, so each is
+    classified once (memoized).
+    """
+    # Skip non-filterable fields
+    if key in _SKIP_FIELDS:
+        return None
+    if not key.startswith(_FILTERABLE_PREFIXES) and key not in _GPA_FIELDS:
+        return None
+    return 'gpa' in key.lower()
+
+
+def _walk_fields(d: Dict, prefix: str, filters: DefaultDict[str, Set[str]],
+                 field_counts: DefaultDict[str, int], gpa_values: List[float],
+                 numeric_fields: DefaultDict[str, List[float]]) -> None:
+    """
+    Record every filterable leaf of a (nested) scholarship dict under its
+    dotted key, without building a flattened copy first.
+    """
+    # Bound once per call: the loop body runs for every leaf of every file
+    field_kind = _field_kind
+    get_values = filters.__getitem__
+    empty_values = _EMPTY_VALUES
+    for k, value in d.items():
+        key = prefix + k
+        if isinstance(value, dict):
+            _walk_fields(value, key + '.', filters, field_counts, gpa_values, numeric_fields)
+            continue
         
-        # Flatten the data to handle nested structures
-        flat_data = flatten_dict(data)
+        is_gpa = field_kind(key)
+        if is_gpa is None:
+            continue
         
-        # Focus on filterable fields - especially in details, flags, and location
-        filterable_prefixes = ['details', 'flags', 'location']
+        # Track field presence
+        field_counts[key] += 1
+        if value is None:
+            continue
         
-        for key, value in flat_data.items():
-            # Skip non-filterable fields
-            if key in ['name', 'description', 'requirements', 'url', 'external_url', 
-                      'application_url', 'foundation', 'status', 'amount', 
-                      'dates.opens', 'dates.closes']:
-                continue
-            
-            # Focus on details, flags, and location fields
-            is_filterable = any(key.startswith(prefix) for prefix in filterable_prefixes)
-            
-            if is_filterable or key in ['minimum_gpa', 'details.minimum_gpa']:
-                # Track field presence
-                field_counts[key] = field_counts.get(key, 0) + 1
-                
-                # Handle special cases
-                if 'gpa' in key.lower() and value is not None:
-                    gpa_val = extract_numeric_gpa(value)
-                    if gpa_val is not None:
-                        gpa_values.append(gpa_val)
-                
-                # Handle numeric fields
-                if isinstance(value, (int, float)):
-                    if key not in numeric_fields:
-                        numeric_fields[key] = []
-                    numeric_fields[key].append(float(value))
-                
-                # Handle string/list values
-                if value is not None:
-                    # Parse comma-separated values
-                    values = parse_comma_separated(value)
-                    for v in values:
-                        if v and v not in ['None', 'null', 'N/A', '']:
-                            if key not in filters:
-                                filters[key] = set()
-                            filters[key].add(v)
+        # Handle special cases
+        if is_gpa:
+            gpa_val = extract_numeric_gpa(value)
+            if gpa_val is not None:
+                gpa_values.append(gpa_val)
+        
+        # Handle numeric fields
+        if isinstance(value, (int, float)):
+            numeric_fields[key].append(float(value))
         
+        # Parse comma-separated values
+        unique_values = get_values(key)
+        for v in parse_comma_separated(value):
+            if v not in empty_values:
+                unique_values.add(v)
+        if not unique_values:
+            # Only fields with at least one real value are filters
+            del filters[key]
+
+
+def analyze_scholarship(file_path: Path, filters: DefaultDict[str, Set[str]], 
+                       field_counts: DefaultDict[str, int], 
+                       gpa_values: List[float],
+                       numeric_fields: DefaultDict[str, List[float]]) -> bool:
+    """Analyze a single scholarship JSON file."""
+    try:
+        data = load_json(file_path)
+        _walk_fields(data, '', filters, field_counts, gpa_values, numeric_fields)
         return True
     except json.JSONDecodeError as e:
         print(f"  ⚠️  Error parsing JSON in {file_path.name}: {e}")
@@ -110,22 +173,92 @@ def analyze_scholarship(file_path: Path, filters: Dict[str, Set[str]],
         return False
 
 
+def _analyze_one(file_path: Path) -> tuple:
+    """
+    Worker-process form of analyze_scholarship: analyze one file into fresh
+    aggregates and return them, as (ok, filters, field_counts, gpa_values,
+    numeric_fields), for the parent to merge.
+    """
+    filters = defaultdict(set)
+    field_counts = defaultdict(int)
+    gpa_values = []
+    numeric_fields = defaultdict(list)
+    ok = analyze_scholarship(file_path, filters, field_counts, gpa_values, numeric_fields)
+    return ok, dict(filters), dict(field_counts), gpa_values, dict(numeric_fields)
+
+
+def gpa_summary(gpa_values: List[float], top: int = 20) -> Dict[str, Any]:
+    """
+    Min/max/average GPA and the `top` most common values (rounded to 2
+    places), computed in one pass.
+    
+    With numpy the reductions run over an array and only the distinct raw
+    values go through Python's round(); counts and tie order match
+    Counter(round(g, 2) for g in gpa_values).most_common(top).
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return {
+            'min': min(gpa_values),
+            'max': max(gpa_values),
+            'avg': sum(gpa_values) / len(gpa_values),
+            'common': Counter(round(g, 2) for g in gpa_values).most_common(top),
+        }
+    
+    arr = np.asarray(gpa_values, dtype=np.float64)
+    distinct, first_seen, counts = np.unique(arr, return_index=True, return_counts=True)
+    # Merge raw values that round to the same GPA, remembering where each
+    # rounded value first appeared (Counter's tie order)
+    rounded = {}
+    for value, first, count in zip(distinct.tolist(), first_seen.tolist(), counts.tolist()):
+        key = round(value, 2)
+        if key in rounded:
+            prev_first, prev_count = rounded[key]
+            rounded[key] = (min(prev_first, first), prev_count + count)
+        else:
+            rounded[key] = (first, count)
+    common = sorted(rounded.items(), key=lambda item: (-item[1][1], item[1][0]))[:top]
+    return {
+        'min': float(arr.min()),
+        'max': float(arr.max()),
+        'avg': float(arr.mean()),
+        'common': [(gpa, count) for gpa, (_, count) in common],
+    }
+
+
+# Filter category by (presence bucket, unique-value bucket):
+# presence <5%, 5-10%, >=10%; unique values <5, 5-50, 51-100, 101-200, >200
+_CATEGORY_TABLE = (
+    ("fair", "fair", "poor", "poor", "poor"),
+    ("fair", "good", "good", "good", "fair"),
+    ("fair", "excellent", "excellent", "good", "fair"),
+)
+
+
 def categorize_filter(field_name: str, unique_count: int, presence_count: int, 
                      total_scholarships: int) -> str:
-    """Categorize a filter as excellent, good, fair, or poor."""
-    presence_pct = (presence_count / total_scholarships) * 100
+    """
+    Categorize a filter as excellent, good, fair, or poor.
     
-    # Excellent: high presence, reasonable unique values (5-100)
-    if presence_pct >= 10 and 5 <= unique_count <= 100:
-        return "excellent"
-    # Good: moderate presence, reasonable unique values
-    elif presence_pct >= 5 and 5 <= unique_count <= 200:
-        return "good"
-    # Fair: either high presence with many values, or low presence with few values
-    elif presence_pct >= 5 or unique_count <= 50:
-        return "fair"
+    Excellent: high presence (>=10%), reasonable unique values (5-100).
+    Good: moderate presence (>=5%), reasonable unique values (5-200).
+    Fair: either >=5% presence with many values, or few values (<=50).
+    Poor: everything else.
+    """
+    presence_pct = (presence_count / total_scholarships) * 100
+    presence_bucket = 2 if presence_pct >= 10 else 1 if presence_pct >= 5 else 0
+    if unique_count < 5:
+        unique_bucket = 0
+    elif unique_count <= 50:
+        unique_bucket = 1
+    elif unique_count <= 100:
+        unique_bucket = 2
+    elif unique_count <= 200:
+        unique_bucket = 3
     else:
-        return "poor"
+        unique_bucket = 4
+    return _CATEGORY_TABLE[presence_bucket][unique_bucket]
 
 
 def main():
@@ -157,15 +290,26 @@ def main():
     processed = 0
     errors = 0
     
-    # Process each file
-    for i, json_file in enumerate(json_files, 1):
-        if i % 1000 == 0 or i == total_files:
-            print(f"📈 Progress: {i:,}/{total_files:,} files processed ({i/total_files*100:.1f}%)")
-        
-        if not analyze_scholarship(json_file, filters, field_counts, gpa_values, numeric_fields):
-            errors += 1
-        
-        processed += 1
+    # Parse files across all cores; imap (not imap_unordered) keeps the
+    # merged GPA values in file order, so ties in the report stay stable
+    with mp.Pool(os.cpu_count()) as pool:
+        partials = pool.imap(_analyze_one, json_files, chunksize=64)
+        for i, (ok, file_filters, file_counts, file_gpas, file_numeric) in enumerate(partials, 1):
+            if i % 1000 == 0 or i == total_files:
+                print(f"📈 Progress: {i:,}/{total_files:,} files processed ({i/total_files*100:.1f}%)")
+            
+            if not ok:
+                errors += 1
+            
+            for key, values in file_filters.items():
+                filters[key] |= values
+            for key, count in file_counts.items():
+                field_counts[key] += count
+            gpa_values.extend(file_gpas)
+            for key, values in file_numeric.items():
+                numeric_fields[key].extend(values)
+            
+            processed += 1
     
     print(f"\n✅ Analysis complete!")
     print(f"   - Processed: {processed:,} files")
@@ -175,6 +319,9 @@ def main():
     # Generate filter report
     print("\n🔍 Generating filter report...\n")
     
+    # Sort each field's values once; the listings and the JSON report reuse them
+    sorted_filters = {field_name: sorted(values) for field_name, values in filters.items()}
+    
     # Sort fields by presence count (most common first)
     sorted_fields = sorted(field_counts.items(), key=lambda x: x[1], reverse=True)
     
@@ -183,10 +330,13 @@ def main():
     good_filters = []
     fair_filters = []
     poor_filters = []
+    # Each field is categorized once here and looked up by the later sections
+    categories = {}
     
     for field_name, presence_count in sorted_fields:
         unique_count = len(filters.get(field_name, set()))
         category = categorize_filter(field_name, unique_count, presence_count, total_files)
+        categories[field_name] = category
         
         filter_info = {
             'field': field_name,
@@ -218,15 +368,15 @@ def main():
     print(f"   - Poor filters: {len(poor_filters)}")
     
     # GPA analysis
-    if gpa_values:
+    gpa_stats = gpa_summary(gpa_values) if gpa_values else None
+    if gpa_stats:
         print(f"\n🎓 GPA Analysis:")
         print(f"   - Scholarships with GPA requirement: {len(gpa_values):,}")
-        print(f"   - Min GPA: {min(gpa_values):.2f}")
-        print(f"   - Max GPA: {max(gpa_values):.2f}")
-        print(f"   - Average GPA: {sum(gpa_values)/len(gpa_values):.2f}")
+        print(f"   - Min GPA: {gpa_stats['min']:.2f}")
+        print(f"   - Max GPA: {gpa_stats['max']:.2f}")
+        print(f"   - Average GPA: {gpa_stats['avg']:.2f}")
         print(f"   - Most common GPA values:")
-        gpa_counter = Counter(round(g, 2) for g in gpa_values)
-        for gpa, count in gpa_counter.most_common(10):
+        for gpa, count in gpa_stats['common'][:10]:
             print(f"     • {gpa:.2f}: {count:,} scholarships")
     
     # Print excellent filters
@@ -239,7 +389,7 @@ def main():
             print(f"     Unique values: {info['unique_values']:,}")
             
             # Show sample values
-            sample_values = list(filters[info['field']])[:10]
+            sample_values = sorted_filters[info['field']][:10]
             if sample_values:
                 print(f"     Sample values: {', '.join(sample_values[:5])}")
                 if len(sample_values) > 5:
@@ -260,7 +410,7 @@ def main():
     for field_name, presence_count in sorted_fields[:50]:  # Top 50
         unique_count = len(filters.get(field_name, set()))
         presence_pct = (presence_count / total_files) * 100
-        category = categorize_filter(field_name, unique_count, presence_count, total_files)
+        category = categories[field_name]
         
         category_emoji = {"excellent": "⭐", "good": "✅", "fair": "⚪", "poor": "❌"}.get(category, "❓")
         
@@ -269,10 +419,10 @@ def main():
         
         # Show all unique values for small sets
         if unique_count <= 20 and unique_count > 0:
-            values = sorted(list(filters[field_name]))
+            values = sorted_filters[field_name]
             print(f"     Values: {', '.join(values)}")
         elif unique_count > 0:
-            sample = sorted(list(filters[field_name]))[:10]
+            sample = sorted_filters[field_name][:10]
             print(f"     Sample values: {', '.join(sample)} ... ({unique_count - 10} more)")
     
     # Save detailed report to JSON
@@ -287,18 +437,18 @@ def main():
         },
         "gpa_analysis": {
             "total_with_gpa": len(gpa_values),
-            "min_gpa": float(min(gpa_values)) if gpa_values else None,
-            "max_gpa": float(max(gpa_values)) if gpa_values else None,
-            "avg_gpa": float(sum(gpa_values)/len(gpa_values)) if gpa_values else None,
-            "common_gpa_values": dict(Counter(round(g, 2) for g in gpa_values).most_common(20))
+            "min_gpa": gpa_stats['min'] if gpa_stats else None,
+            "max_gpa": gpa_stats['max'] if gpa_stats else None,
+            "avg_gpa": gpa_stats['avg'] if gpa_stats else None,
+            "common_gpa_values": dict(gpa_stats['common']) if gpa_stats else {}
         },
         "filters": {}
     }
     
-    for field_name in sorted(filters.keys()):
+    for field_name in sorted(sorted_filters):
         presence_count = field_counts.get(field_name, 0)
-        unique_values = sorted(list(filters[field_name]))
-        category = categorize_filter(field_name, len(unique_values), presence_count, total_files)
+        unique_values = sorted_filters[field_name]
+        category = categories[field_name]
         
         report["filters"][field_name] = {
             "presence_count": presence_count,
@@ -310,8 +460,7 @@ def main():
         }
     
     output_file = Path(__file__).parent / "filter_report.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+    dump_json(report, output_file)
     
     print(f"\n💾 Detailed report saved to: {output_file}")
     print(f"\n✨ Filter discovery complete!")
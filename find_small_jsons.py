@@ -12,21 +12,41 @@ from pathlib import Path
 from typing import Iterable, Tuple
 
 
-def iter_small_json_files(root: Path, max_bytes: int) -> Iterable[Tuple[Path, int]]:
+def _is_json_name(name: str) -> bool:
+    """Case-insensitive '.json' suffix check."""
+    # The '.' test rejects most other files before any lowercasing
+    return len(name) > 5 and name[-5] == "." and name[-4:].lower() == "json"
+
+
+def iter_small_json_files(root: Path | str, max_bytes: int) -> Iterable[Tuple[str, int]]:
     """
     Yield (path, size) pairs for JSON files under max_bytes within root.
+
+    Walks the tree with os.scandir so file/directory checks use the cached
+    directory entry type; only JSON files are stat'ed. Hidden files and
+    directories (names starting with '.') are skipped. Paths are yielded as
+    strings, leaving Path construction to the caller.
     """
-    for dirpath, _, filenames in os.walk(root):
-        for filename in filenames:
-            if not filename.lower().endswith(".json"):
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith("."):
                 continue
-            path = Path(dirpath) / filename
             try:
-                size = path.stat().st_size
+                if entry.is_dir(follow_symlinks=False):
+                    yield from iter_small_json_files(entry.path, max_bytes)
+                    continue
+                if not _is_json_name(name) or not entry.is_file():
+                    continue
+                size = entry.stat().st_size
             except OSError:
                 continue
             if size < max_bytes:
-                yield (path, size)
+                yield (entry.path, size)
 
 
 def main() -> None:
@@ -50,7 +70,7 @@ def main() -> None:
     root = args.root.resolve()
     matches = sorted(
         (
-            (path.relative_to(root), size)
+            (Path(path).relative_to(root), size)
             for path, size in iter_small_json_files(root, args.max_bytes)
         ),
         key=lambda item: item[0].as_posix(),
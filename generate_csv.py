@@ -4,13 +4,44 @@ Script to generate a CSV file from scholarship JSON files.
 Includes all categories that are NOT "poor" (excluding details.graduated_area_of_study).
 """
 
+import argparse
 import json
 import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 
-def flatten_dict(d: Dict, parent_key: str = '', sep: str = '.') -> Dict[str, Any]:
+# Resolve the JSON parser once per process, not per file
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+
+def load_json(json_file: Union[str, Path]) -> Any:
+    """Read and parse a JSON file (orjson if installed, else json)."""
+    with open(json_file, 'rb') as f:
+        return _loads(f.read())
+
+
+def list_json_files(directory: Path) -> List[str]:
+    """
+    Paths (as strings) of the *.json files directly in directory.
+    
+    os.scandir avoids building a Path per entry the way Path.glob does;
+    dot-prefixed files are included, as glob('*.json') includes them.
+    """
+    with os.scandir(directory) as entries:
+        return [
+            entry.path for entry in entries
+            if entry.name.endswith('.json') and entry.is_file()
+        ]
+
+
+def flatten_dict(d: Dict[str, Any], parent_key: str = '', sep: str = '.') -> Dict[str, Any]:
     """Flatten a nested dictionary."""
     items = []
     for k, v in d.items():
@@ -22,10 +53,15 @@ def flatten_dict(d: Dict, parent_key: str = '', sep: str = '.') -> Dict[str, Any
     return dict(items)
 
 
-def get_nested_value(data: Dict, path: str, default: str = '') -> str:
+def get_nested_value(data: Dict[str, Any], path: str, default: str = '') -> str:
     """Get a value from a nested dictionary using dot notation."""
-    keys = path.split('.')
-    value = data
+    return _nested_value(data, tuple(path.split('.')), default)
+
+
+def _nested_value(data: Dict[str, Any], keys: Tuple[str, ...], default: str = '') -> str:
+    """get_nested_value with the path already split into keys."""
+    # Any, not Dict: value becomes whatever the path leads to
+    value: Any = data
     for key in keys:
         if isinstance(value, dict):
             value = value.get(key)
@@ -34,7 +70,10 @@ def get_nested_value(data: Dict, path: str, default: str = '') -> str:
         if value is None:
             return default
     
-    # Convert to string, handling lists and other types
+    # Convert to string, handling lists and other types; most values are
+    # already plain strings and are returned as they are
+    if type(value) is str:
+        return value
     if isinstance(value, list):
         return '; '.join(str(v) for v in value if v)
     if value is None:
@@ -46,66 +85,212 @@ def parse_comma_separated(value: Any) -> str:
     """Parse comma-separated values and return as semicolon-separated string."""
     if value is None:
         return ''
+    if type(value) is str and ',' not in value:
+        # Single value: nothing to split
+        return value.strip()
     if isinstance(value, list):
-        return '; '.join(str(v).strip() for v in value if v and str(v).strip())
+        return '; '.join(s for s in (str(v).strip() for v in value if v) if s)
     if isinstance(value, str):
-        # Split by comma and clean up
-        values = [v.strip() for v in value.split(',') if v.strip()]
-        return '; '.join(values)
+        # Split by comma and clean up, stripping each part once
+        return '; '.join(s for s in (v.strip() for v in value.split(',')) if s)
     return str(value).strip() if value else ''
 
 
-def extract_scholarship_data(json_file: Path) -> Optional[Dict[str, str]]:
-    """Extract scholarship data from a JSON file."""
+# Write buffer for the output CSV (4 MiB)
+_WRITE_BUFFER_SIZE = 1 << 22
+
+# CSV columns (matching original format + new categories); rows are tuples
+# in this order
+COLUMNS = (
+    'name_of_scholarship',
+    'foundation',
+    'date_opens',
+    'date_closes',
+    'description',
+    'dollar_amount',
+    'amount_text',
+    'essay_required',
+    'need_based',
+    'merit_based',
+    'application_website',
+    'original_bigfuture_link',
+    'pursued_degree_level',
+    'current_grade',
+    'country',
+    'state',
+    'county',
+    'city',
+    'current_school',
+    'minimum_gpa',
+    'intended_area_of_study',
+    'requirements',
+    'status',
+    'url',
+    # New categories
+    'citizenship_status',
+    'activities',
+    'affiliations',
+    'armed_service_branch',
+    'armed_service_status',
+    'maximum_age',
+    'minimum_age',
+    'situation',
+)
+
+
+# Columns read from nested paths: (column, path keys, comma-separated list?).
+# Paths are split once here rather than on every file
+_NESTED_FIELDS = tuple(
+    (column, tuple(path.split('.')), is_list)
+    for column, path, is_list in (
+        ('essay_required', 'flags.essay_required', False),
+        ('need_based', 'flags.need_based', False),
+        ('merit_based', 'flags.merit_based', False),
+        ('pursued_degree_level', 'details.pursued_degree_level', True),
+        ('current_grade', 'details.current_grade', True),
+        ('country', 'details.location.country', False),
+        ('state', 'details.location.state', False),
+        ('county', 'details.location.county', False),
+        ('city', 'details.location.city', False),
+        ('current_school', 'details.current_school', False),
+        ('minimum_gpa', 'details.minimum_gpa', False),
+        ('intended_area_of_study', 'details.intended_area_of_study', True),
+        # New categories (non-poor, excluding details.graduated_area_of_study)
+        ('citizenship_status', 'details.citizenship_status', True),
+        ('activities', 'details.activities', True),
+        ('affiliations', 'details.affiliations', True),
+        ('armed_service_branch', 'details.armed_service_branch', True),
+        ('armed_service_status', 'details.armed_service_status', True),
+        ('maximum_age', 'details.maximum_age', False),
+        ('minimum_age', 'details.minimum_age', False),
+        ('situation', 'details.situation', True),
+    )
+)
+
+
+def extract_scholarship_data(json_file: Union[str, Path]) -> Optional[Tuple[Any, ...]]:
+    """Extract one CSV row, ordered as COLUMNS, from a scholarship JSON file."""
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json(json_file)
         
-        # Extract basic fields
-        row = {
-            'name_of_scholarship': data.get('name', ''),
-            'foundation': data.get('foundation', ''),
-            'date_opens': data.get('dates', {}).get('opens', ''),
-            'date_closes': data.get('dates', {}).get('closes', ''),
-            'description': data.get('description', ''),
-            'dollar_amount': str(data.get('amount', '')).replace('Award Amount Varies', '').strip(),
-            'amount_text': data.get('amount', ''),
-            'essay_required': get_nested_value(data, 'flags.essay_required', ''),
-            'need_based': get_nested_value(data, 'flags.need_based', ''),
-            'merit_based': get_nested_value(data, 'flags.merit_based', ''),
-            'application_website': data.get('application_url', ''),
-            'original_bigfuture_link': data.get('url', ''),
-            'pursued_degree_level': parse_comma_separated(get_nested_value(data, 'details.pursued_degree_level', '')),
-            'current_grade': parse_comma_separated(get_nested_value(data, 'details.current_grade', '')),
-            'country': get_nested_value(data, 'details.location.country', ''),
-            'state': get_nested_value(data, 'details.location.state', ''),
-            'county': get_nested_value(data, 'details.location.county', ''),
-            'city': get_nested_value(data, 'details.location.city', ''),
-            'current_school': get_nested_value(data, 'details.current_school', ''),
-            'minimum_gpa': get_nested_value(data, 'details.minimum_gpa', ''),
-            'intended_area_of_study': parse_comma_separated(get_nested_value(data, 'details.intended_area_of_study', '')),
-            'requirements': '; '.join(data.get('requirements', [])) if isinstance(data.get('requirements'), list) else str(data.get('requirements', '')),
-            'status': data.get('status', ''),
-            'url': data.get('url', ''),
-            # New categories (non-poor, excluding details.graduated_area_of_study)
-            'citizenship_status': parse_comma_separated(get_nested_value(data, 'details.citizenship_status', '')),
-            'activities': parse_comma_separated(get_nested_value(data, 'details.activities', '')),
-            'affiliations': parse_comma_separated(get_nested_value(data, 'details.affiliations', '')),
-            'armed_service_branch': parse_comma_separated(get_nested_value(data, 'details.armed_service_branch', '')),
-            'armed_service_status': parse_comma_separated(get_nested_value(data, 'details.armed_service_status', '')),
-            'maximum_age': get_nested_value(data, 'details.maximum_age', ''),
-            'minimum_age': get_nested_value(data, 'details.minimum_age', ''),
-            'situation': parse_comma_separated(get_nested_value(data, 'details.situation', '')),
-        }
+        nested: List[str] = []
+        for _, keys, is_list in _NESTED_FIELDS:
+            value = _nested_value(data, keys)
+            nested.append(parse_comma_separated(value) if is_list else value)
+        amount = data.get('amount', '')
+        requirements = data.get('requirements', [])
+        url = data.get('url', '')
         
-        return row
+        # nested[0:3] are the flags, nested[3:12] the details up to
+        # intended_area_of_study, nested[12:] the new categories
+        return (
+            data.get('name', ''),
+            data.get('foundation', ''),
+            data.get('dates', {}).get('opens', ''),
+            data.get('dates', {}).get('closes', ''),
+            data.get('description', ''),
+            str(amount).replace('Award Amount Varies', '').strip(),
+            amount,
+            *nested[:3],
+            data.get('application_url', ''),
+            url,
+            *nested[3:12],
+            '; '.join(requirements) if isinstance(requirements, list) else str(requirements),
+            data.get('status', ''),
+            url,
+            *nested[12:],
+        )
     except Exception as e:
-        print(f"  ⚠️  Error reading {json_file.name}: {e}")
+        print(f"  ⚠️  Error reading {os.path.basename(json_file)}: {e}")
         return None
 
 
-def main():
-    """Main function to generate CSV from scholarship JSON files."""
+# Files between progress lines
+_PROGRESS_EVERY = 1000
+
+
+def _with_progress(rows: Iterable[Optional[Tuple[Any, ...]]], total_files: int) -> Iterator[Optional[Tuple[Any, ...]]]:
+    """Pass rows through, printing progress every _PROGRESS_EVERY files."""
+    # Rows go through in blocks, so the per-row path has no progress check
+    rows = iter(rows)
+    done = 0
+    while done < total_files:
+        yield from islice(rows, _PROGRESS_EVERY)
+        done = min(done + _PROGRESS_EVERY, total_files)
+        print(f"📈 Progress: {done:,}/{total_files:,} files processed ({done/total_files*100:.1f}%)")
+
+
+def write_csv(rows: Iterable[Optional[Tuple[Any, ...]]], output_file: Path) -> Tuple[int, int]:
+    """Write rows (None for files that failed) to CSV; returns (processed, errors)."""
+    processed = 0
+    errors = 0
+    
+    # The large buffer turns many small row writes into few write() calls;
+    # nothing is flushed until the file is closed
+    with open(output_file, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as csvfile:
+        writer = csv.writer(csvfile, quoting=csv.QUOTE_MINIMAL)
+        writer.writerow(COLUMNS)
+        batch = []
+        for row in rows:
+            if row:
+                batch.append(row)
+                processed += 1
+                if len(batch) == 1000:
+                    writer.writerows(batch)
+                    batch.clear()
+            else:
+                errors += 1
+        writer.writerows(batch)
+    
+    return processed, errors
+
+
+def write_parquet(rows: Iterable[Optional[Tuple[Any, ...]]], output_file: Path) -> Tuple[int, int]:
+    """
+    Write rows (None for files that failed) to a zstd-compressed Parquet file;
+    returns (processed, errors). Requires pyarrow.
+    
+    Rows are gathered column by column. Every value is stored as a string,
+    as in the CSV, since columns such as amount mix numbers and text.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    processed = 0
+    errors = 0
+    columns = {column: [] for column in COLUMNS}
+    appends = [columns[column].append for column in COLUMNS]
+    for row in rows:
+        if row:
+            for append, value in zip(appends, row):
+                append('' if value is None else str(value))
+            processed += 1
+        else:
+            errors += 1
+    
+    pq.write_table(pa.table(columns), output_file, compression='zstd', use_dictionary=True)
+    return processed, errors
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main function to generate CSV (or Parquet) from scholarship JSON files."""
+    parser = argparse.ArgumentParser(description="Generate a CSV file from scholarship JSON files.")
+    parser.add_argument(
+        "--format",
+        choices=("csv", "parquet"),
+        default="csv",
+        help="Output format (parquet requires pyarrow; defaults to csv).",
+    )
+    args = parser.parse_args(argv)
+    
+    output_format = args.format
+    if output_format == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            print("⚠️  pyarrow is not installed - writing CSV instead")
+            output_format = "csv"
+    
     scholarships_dir = Path(__file__).parent / "scholarships"
     
     if not scholarships_dir.exists():
@@ -115,7 +300,7 @@ def main():
     print(f"📁 Scanning directory: {scholarships_dir}")
     
     # Get all JSON files
-    json_files = list(scholarships_dir.glob("*.json"))
+    json_files = list_json_files(scholarships_dir)
     total_files = len(json_files)
     
     if total_files == 0:
@@ -123,72 +308,23 @@ def main():
         return
     
     print(f"📊 Found {total_files:,} JSON files to process")
-    print("🚀 Starting CSV generation...\n")
-    
-    # Define CSV columns (matching original format + new categories)
-    columns = [
-        'name_of_scholarship',
-        'foundation',
-        'date_opens',
-        'date_closes',
-        'description',
-        'dollar_amount',
-        'amount_text',
-        'essay_required',
-        'need_based',
-        'merit_based',
-        'application_website',
-        'original_bigfuture_link',
-        'pursued_degree_level',
-        'current_grade',
-        'country',
-        'state',
-        'county',
-        'city',
-        'current_school',
-        'minimum_gpa',
-        'intended_area_of_study',
-        'requirements',
-        'status',
-        'url',
-        # New categories
-        'citizenship_status',
-        'activities',
-        'affiliations',
-        'armed_service_branch',
-        'armed_service_status',
-        'maximum_age',
-        'minimum_age',
-        'situation',
-    ]
+    print(f"🚀 Starting {output_format.upper()} generation...\n")
     
     # Output file
-    output_file = Path(__file__).parent / "scholarships_updated.csv"
-    
-    # Process all files and write to CSV
-    processed = 0
-    errors = 0
+    output_file = Path(__file__).parent / f"scholarships_updated.{output_format}"
+    write = write_parquet if output_format == "parquet" else write_csv
     
-    with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=columns, quoting=csv.QUOTE_MINIMAL)
-        writer.writeheader()
-        
-        for i, json_file in enumerate(json_files, 1):
-            if i % 1000 == 0 or i == total_files:
-                print(f"📈 Progress: {i:,}/{total_files:,} files processed ({i/total_files*100:.1f}%)")
-            
-            row = extract_scholarship_data(json_file)
-            if row:
-                writer.writerow(row)
-                processed += 1
-            else:
-                errors += 1
+    # Files are parsed across all cores; rows come back in file order and
+    # are written here so only one process touches the output file
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        rows = executor.map(extract_scholarship_data, json_files, chunksize=256)
+        processed, errors = write(_with_progress(rows, total_files), output_file)
     
-    print(f"\n✅ CSV generation complete!")
+    print(f"\n✅ {output_format.upper()} generation complete!")
     print(f"   - Processed: {processed:,} scholarships")
     print(f"   - Errors: {errors:,} files")
     print(f"   - Output file: {output_file}")
-    print(f"\n✨ CSV file created successfully!")
+    print(f"\n✨ {output_format.upper()} file created successfully!")
 
 
 if __name__ == "__main__":
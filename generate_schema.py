@@ -6,9 +6,10 @@ suitable for creating a Supabase table.
 
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from collections import defaultdict
-from typing import Any, Dict, Set, Union
+from typing import Any, Dict, List, Set, Tuple, Union
 
 
 def get_json_type(value: Any) -> str:
@@ -31,54 +32,104 @@ def get_json_type(value: Any) -> str:
         return "unknown"
 
 
-def analyze_value(value: Any, field_path: str, schema: Dict[str, Set[str]]) -> None:
-    """Recursively analyze a value and update the schema."""
-    json_type = get_json_type(value)
-    
-    # Add this type to the field's possible types
-    if field_path not in schema:
-        schema[field_path] = set()
-    schema[field_path].add(json_type)
+# One bit per JSON type; a field's schema entry is the OR of the bits of
+# every type seen for it
+TYPE_BITS = {
+    "null": 1,
+    "boolean": 2,
+    "integer": 4,
+    "number": 8,
+    "string": 16,
+    "array": 32,
+    "object": 64,
+    "unknown": 128,
+}
+_ARRAY_BIT = TYPE_BITS["array"]
+_OBJECT_BIT = TYPE_BITS["object"]
+
+# Exact-type lookup for parsed JSON values (bool is checked before int)
+_BITS_BY_PYTYPE = {
+    type(None): TYPE_BITS["null"],
+    bool: TYPE_BITS["boolean"],
+    int: TYPE_BITS["integer"],
+    float: TYPE_BITS["number"],
+    str: TYPE_BITS["string"],
+    list: _ARRAY_BIT,
+    dict: _OBJECT_BIT,
+}
+
+
+def get_json_typebit(value: Any) -> int:
+    """Determine the JSON type of a value as its TYPE_BITS bit."""
+    bit = _BITS_BY_PYTYPE.get(type(value))
+    if bit is None:
+        # Subclasses of the JSON types
+        return TYPE_BITS[get_json_type(value)]
+    return bit
+
+
+def types_from_bits(bits: int) -> Set[str]:
+    """Expand a TYPE_BITS mask back into its set of JSON type names."""
+    return {name for name, bit in TYPE_BITS.items() if bits & bit}
+
+
+def analyze_value(value: Any, field_path: str, schema: Dict[str, int]) -> None:
+    """
+    Analyze a value and everything nested in it, updating the schema.
     
-    # Handle nested objects
-    if json_type == "object" and value:
-        for key, val in value.items():
-            nested_path = f"{field_path}.{key}" if field_path else key
-            analyze_value(val, nested_path, schema)
+    Walks with an explicit stack rather than recursing. The first 5 elements
+    of an array are recorded under "<path>[]"; objects among them are walked
+    further, nested arrays are not.
+    """
+    stack = [(value, field_path, True)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        val, path, walk_array = pop()
+        type_bit = get_json_typebit(val)
+        schema[path] = schema.get(path, 0) | type_bit
+        
+        if type_bit == _OBJECT_BIT:
+            for key, item in val.items():
+                push((item, f"{path}.{key}" if path else key, True))
+        elif type_bit == _ARRAY_BIT and walk_array and val:
+            item_path = f"{path}[]"
+            for item in val[:5]:  # Sample first 5 elements
+                push((item, item_path, False))
+
+
+# Parser bound once at import rather than looked up on every file; orjson
+# if installed, else json.loads (which reuses the stdlib's shared decoder)
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+
+def load_json(file_path: Union[str, Path]) -> Any:
+    """Parse a JSON file from raw bytes, with orjson when available."""
+    with open(file_path, 'rb') as f:
+        return _loads(f.read())
+
+
+def list_json_files(directory: Path) -> List[str]:
+    """
+    Paths (as strings) of the *.json files directly in directory.
     
-    # Handle arrays - analyze the types of array elements
-    elif json_type == "array" and value:
-        # Check if array is empty or has elements
-        if len(value) > 0:
-            # Analyze first few elements to determine array item type
-            element_types = set()
-            for i, item in enumerate(value[:5]):  # Sample first 5 elements
-                item_type = get_json_type(item)
-                element_types.add(item_type)
-                # If array contains objects, analyze them
-                if item_type == "object" and item:
-                    for obj_key, obj_val in item.items():
-                        nested_path = f"{field_path}[].{obj_key}" if field_path else f"[].{obj_key}"
-                        analyze_value(obj_val, nested_path, schema)
-            
-            # Store array element types
-            array_item_path = f"{field_path}[]" if field_path else "[]"
-            if array_item_path not in schema:
-                schema[array_item_path] = set()
-            schema[array_item_path].update(element_types)
-        else:
-            # Empty array - mark as array type
-            array_item_path = f"{field_path}[]" if field_path else "[]"
-            if array_item_path not in schema:
-                schema[array_item_path] = set()
-            schema[array_item_path].add("null")  # Empty arrays could be any type
+    os.scandir avoids building a Path per entry the way Path.glob does;
+    dot-prefixed files are included, as glob('*.json') includes them.
+    """
+    with os.scandir(directory) as entries:
+        return [
+            entry.path for entry in entries
+            if entry.name.endswith('.json') and entry.is_file()
+        ]
 
 
-def analyze_json_file(file_path: Path, schema: Dict[str, Set[str]]) -> bool:
+def analyze_json_file(file_path: Union[str, Path], schema: Dict[str, int]) -> bool:
     """Analyze a single JSON file and update the schema."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json(file_path)
         
         # Analyze the root object
         if isinstance(data, dict):
@@ -89,13 +140,20 @@ def analyze_json_file(file_path: Path, schema: Dict[str, Set[str]]) -> bool:
         
         return True
     except json.JSONDecodeError as e:
-        print(f"  ⚠️  Error parsing JSON in {file_path.name}: {e}")
+        print(f"  ⚠️  Error parsing JSON in {os.path.basename(file_path)}: {e}")
         return False
     except Exception as e:
-        print(f"  ⚠️  Error reading {file_path.name}: {e}")
+        print(f"  ⚠️  Error reading {os.path.basename(file_path)}: {e}")
         return False
 
 
+def _analyze_file(file_path: Union[str, Path]) -> Tuple[bool, Dict[str, int]]:
+    """Analyze one file into its own schema (for worker processes)."""
+    schema = {}
+    ok = analyze_json_file(file_path, schema)
+    return ok, schema
+
+
 def json_type_to_supabase_type(field_types: Set[str], field_name: str) -> Dict[str, Any]:
     """Convert JSON types to Supabase/PostgreSQL types."""
     # Remove null from types for type determination
@@ -171,8 +229,8 @@ def json_type_to_supabase_type(field_types: Set[str], field_name: str) -> Dict[s
         }
 
 
-def generate_schema_json(schema: Dict[str, Set[str]]) -> Dict[str, Any]:
-    """Generate the final schema JSON structure."""
+def generate_schema_json(schema: Dict[str, int]) -> Dict[str, Any]:
+    """Generate the final schema JSON structure from path -> TYPE_BITS masks."""
     result = {
         "fields": {},
         "summary": {
@@ -185,11 +243,12 @@ def generate_schema_json(schema: Dict[str, Set[str]]) -> Dict[str, Any]:
     # Sort fields by path
     sorted_fields = sorted(schema.items())
     
-    for field_path, types in sorted_fields:
+    for field_path, bits in sorted_fields:
         # Skip array item type markers (we'll handle arrays differently)
         if field_path.endswith("[]") and not field_path.startswith("[]"):
             continue
         
+        types = types_from_bits(bits)
         field_info = json_type_to_supabase_type(types, field_path)
         field_info["json_types"] = sorted(list(types))
         
@@ -215,7 +274,7 @@ def main():
     print(f"📁 Scanning directory: {scholarships_dir}")
     
     # Get all JSON files
-    json_files = list(scholarships_dir.glob("*.json"))
+    json_files = list_json_files(scholarships_dir)
     total_files = len(json_files)
     
     if total_files == 0:
@@ -225,19 +284,25 @@ def main():
     print(f"📊 Found {total_files:,} JSON files to analyze")
     print("🚀 Starting analysis...\n")
     
-    schema = defaultdict(set)
+    schema: Dict[str, int] = {}
     processed = 0
     errors = 0
     
-    # Process each file
-    for i, json_file in enumerate(json_files, 1):
-        if i % 1000 == 0 or i == total_files:
-            print(f"📈 Progress: {i:,}/{total_files:,} files processed ({i/total_files*100:.1f}%)")
-        
-        if not analyze_json_file(json_file, schema):
-            errors += 1
-        
-        processed += 1
+    # Each worker builds a schema for its file; the parent unions them
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = executor.map(_analyze_file, json_files, chunksize=128)
+        # Merged 1000 files at a time, printing progress between blocks
+        # rather than testing for it on every file
+        for start in range(0, total_files, 1000):
+            for ok, file_schema in islice(results, 1000):
+                if not ok:
+                    errors += 1
+                for field_path, bits in file_schema.items():
+                    schema[field_path] = schema.get(field_path, 0) | bits
+                
+                processed += 1
+            
+            print(f"📈 Progress: {processed:,}/{total_files:,} files processed ({processed/total_files*100:.1f}%)")
     
     print(f"\n✅ Analysis complete!")
     print(f"   - Processed: {processed:,} files")
@@ -250,8 +315,14 @@ def main():
     
     # Write to file
     output_file = Path(__file__).parent / "schema.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(schema_json, f, indent=2, ensure_ascii=False)
+    try:
+        import orjson
+    except ImportError:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(schema_json, f, indent=2, ensure_ascii=False)
+    else:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(schema_json, option=orjson.OPT_INDENT_2))
     
     print(f"💾 Schema written to: {output_file}")
     print(f"\n📋 Schema Summary:")
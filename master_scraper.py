@@ -4,29 +4,56 @@ Orchestrates the scraping of all scholarships from the queue
 """
 
 import csv
-import json
 import os
+import sqlite3
+import threading
 import time
 import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from scholarship_detail_scraper import ScholarshipDetailScraper
-from bigfuture_scraper import PageNotFoundError
+from bigfuture_scraper import PageNotFoundError, write_json
+
+# Characters dropped from scholarship names to make filenames
+_FILENAME_UNSAFE_RE = re.compile(r'[^\w\s-]')
 
 
 class MasterScraper:
-    def __init__(self, scholarships_csv='scholarships.csv', queue_csv='scholarship_queue.csv', output_dir='scholarships', max_retries=3):
+    def __init__(self, scholarships_csv='scholarships.csv', queue_db='scholarship_queue.db', output_dir='scholarships', max_retries=3,
+                 remote_url=None):
         self.scholarships_csv = scholarships_csv
-        self.queue_csv = queue_csv
+        # SQLite queue: marking one scholarship done is a single-row UPDATE
+        # instead of rewriting a queue CSV
+        self.queue_db = queue_db
+        self.queue = sqlite3.connect(queue_db)
+        self.queue.execute(
+            'CREATE TABLE IF NOT EXISTS queue ('
+            'name TEXT, url TEXT, is_scraped INTEGER NOT NULL DEFAULT 0)'
+        )
+        self.queue.execute('CREATE INDEX IF NOT EXISTS queue_url ON queue (url)')
+        # Ordered by (is_scraped, rowid): the next unscraped row is one index seek
+        self.queue.execute('CREATE INDEX IF NOT EXISTS queue_is_scraped ON queue (is_scraped)')
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
-        self.scraper = ScholarshipDetailScraper()
+        # Names of the JSON files already in output_dir, so is_scraped() is a
+        # set lookup rather than a stat() per scholarship
+        with os.scandir(self.output_dir) as entries:
+            self._scraped_files = {entry.name for entry in entries if entry.name.endswith('.json')}
+        # Selenium Grid address for the browsers; None runs a local Chrome per worker
+        self.remote_url = remote_url
+        self.scraper = ScholarshipDetailScraper(remote_url=remote_url)
         self.max_retries = max_retries
+        # Per-thread scrapers for concurrent runs (see _thread_scraper)
+        self._local = threading.local()
+        self._scrapers_lock = threading.Lock()
+        self._main_scraper_taken = False
+        self._worker_scrapers = []
         
     def generate_filename(self, scholarship_name, url):
         """Generate a safe filename from scholarship name or URL"""
         if scholarship_name:
             # Clean the name for filename
-            filename = re.sub(r'[^\w\s-]', '', scholarship_name).strip()
+            filename = _FILENAME_UNSAFE_RE.sub('', scholarship_name).strip()
             filename = filename.replace(' ', '_')
             filename = filename[:100]  # Limit length
             if filename:
@@ -40,14 +67,13 @@ class MasterScraper:
     def is_scraped(self, scholarship_name, url, verbose=False):
         """Check if a scholarship has already been scraped"""
         filename = self.generate_filename(scholarship_name, url)
-        filepath = self.output_dir / filename
-        exists = filepath.exists()
+        exists = filename in self._scraped_files
         if exists and verbose:
             print(f"    [SKIP] Already scraped: {filename}")
         return exists
     
     def initialize_queue(self):
-        """Initialize or update the scholarship queue CSV"""
+        """Initialize or update the scholarship queue"""
         print("=" * 70)
         print("STEP 1: Initializing scholarship queue...")
         print("=" * 70)
@@ -63,38 +89,30 @@ class MasterScraper:
         
         # Check which ones are already scraped
         print(f"\nChecking existing files in: {self.output_dir}/")
-        existing_files = list(self.output_dir.glob('*.json'))
-        print(f"  ✓ Found {len(existing_files)} existing JSON files")
+        print(f"  ✓ Found {len(self._scraped_files)} existing JSON files")
         
         print("\nChecking which scholarships are already scraped...")
-        queue_data = []
-        scraped_count = 0
-        for i, scholarship in enumerate(scholarships):
-            name = scholarship.get('Scholarship Name', '')
-            url = scholarship.get('URL', '')
-            is_scraped = self.is_scraped(name, url, verbose=False)
-            
-            if is_scraped:
-                scraped_count += 1
-            
-            queue_data.append({
+        existing = self._scraped_files
+        queue_data = [
+            {
                 'Scholarship Name': name,
                 'URL': url,
-                'is_scraped': 'True' if is_scraped else 'False'
-            })
-            
-            # Print progress every 1000 items
-            if (i + 1) % 1000 == 0:
-                print(f"  Checked {i + 1}/{len(scholarships)} scholarships...")
+                'is_scraped': 'True' if self.generate_filename(name, url) in existing else 'False'
+            }
+            for name, url in ((s.get('Scholarship Name', ''), s.get('URL', '')) for s in scholarships)
+        ]
+        scraped_count = sum(item['is_scraped'] == 'True' for item in queue_data)
         
-        # Write the queue CSV
-        print(f"\nWriting queue to: {self.queue_csv}")
-        with open(self.queue_csv, 'w', newline='', encoding='utf-8') as f:
-            fieldnames = ['Scholarship Name', 'URL', 'is_scraped']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(queue_data)
-        print(f"  ✓ Queue CSV written")
+        # Rebuild the queue table in one transaction
+        print(f"\nWriting queue to: {self.queue_db}")
+        with self.queue:
+            self.queue.execute('DELETE FROM queue')
+            self.queue.executemany(
+                'INSERT INTO queue (name, url, is_scraped) VALUES (?, ?, ?)',
+                ((item['Scholarship Name'], item['URL'], item['is_scraped'] == 'True')
+                 for item in queue_data),
+            )
+        print(f"  ✓ Queue written")
         
         remaining_count = len(queue_data) - scraped_count
         
@@ -109,68 +127,142 @@ class MasterScraper:
         return queue_data
     
     def update_queue(self, url, is_scraped=True):
-        """Update the queue CSV to mark a scholarship as scraped"""
-        # Read current queue
-        queue_data = []
-        updated = False
-        with open(self.queue_csv, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row['URL'] == url:
-                    old_status = row['is_scraped']
-                    row['is_scraped'] = 'True' if is_scraped else 'False'
-                    if old_status != row['is_scraped']:
-                        updated = True
-                        print(f"    [QUEUE] Updated status: {old_status} -> {row['is_scraped']}")
-                queue_data.append(row)
-        
-        # Write updated queue
+        """Mark a scholarship as scraped (or not) in the queue"""
+        new_status = 1 if is_scraped else 0
+        with self.queue:
+            updated = self.queue.execute(
+                'UPDATE queue SET is_scraped = ? WHERE url = ? AND is_scraped != ?',
+                (new_status, url, new_status),
+            ).rowcount
         if updated:
-            with open(self.queue_csv, 'w', newline='', encoding='utf-8') as f:
-                fieldnames = ['Scholarship Name', 'URL', 'is_scraped']
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(queue_data)
-            print(f"    [QUEUE] Queue file updated")
+            print(f"    [QUEUE] Updated status: {not is_scraped} -> {bool(is_scraped)}")
+            print(f"    [QUEUE] Queue updated")
     
     def get_next_unscraped(self):
         """Get the next unscraped scholarship from the queue"""
-        with open(self.queue_csv, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row['is_scraped'] == 'False':
-                    # Double-check it's not already scraped (safety check)
-                    name = row.get('Scholarship Name', '')
-                    url = row.get('URL', '')
-                    if self.is_scraped(name, url, verbose=False):
-                        print(f"    [WARNING] Found in queue as unscraped, but file exists! Marking as scraped...")
-                        self.update_queue(url, is_scraped=True)
-                        continue
-                    return row
-        return None
+        while True:
+            row = self.queue.execute(
+                'SELECT name, url FROM queue WHERE is_scraped = 0 ORDER BY rowid LIMIT 1'
+            ).fetchone()
+            if row is None:
+                return None
+            name, url = row
+            # Double-check it's not already scraped (safety check)
+            if self.is_scraped(name, url, verbose=False):
+                print(f"    [WARNING] Found in queue as unscraped, but file exists! Marking as scraped...")
+                self.update_queue(url, is_scraped=True)
+                continue
+            return {'Scholarship Name': name, 'URL': url, 'is_scraped': 'False'}
     
     def count_remaining(self):
         """Count how many scholarships are still unscraped"""
-        count = 0
-        with open(self.queue_csv, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row['is_scraped'] == 'False':
-                    count += 1
-        return count
+        return self.queue.execute('SELECT COUNT(*) FROM queue WHERE is_scraped = 0').fetchone()[0]
+    
+    def close(self):
+        """Close the queue database and every scraper's browser"""
+        self.queue.close()
+        self.scraper.close()
+        for scraper in self._worker_scrapers:
+            scraper.close()
     
     def save_scholarship_json(self, scholarship_data, scholarship_name, url):
         """Save scholarship data to JSON file"""
         filename = self.generate_filename(scholarship_name, url)
         filepath = self.output_dir / filename
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(scholarship_data, f, indent=2, ensure_ascii=False)
+        write_json(scholarship_data, filepath)
+        self._scraped_files.add(filename)
         
         return filepath
     
-    def run(self, delay=1.0):
-        """Main method to run the scraping process"""
+    def _pending_scholarships(self):
+        """(name, url) of every unscraped queue entry, in queue order"""
+        pending = []
+        for name, url in self.queue.execute(
+                'SELECT name, url FROM queue WHERE is_scraped = 0 ORDER BY rowid').fetchall():
+            # Double-check it's not already scraped (safety check)
+            if self.is_scraped(name, url, verbose=False):
+                print(f"    [WARNING] Found in queue as unscraped, but file exists! Marking as scraped...")
+                self.update_queue(url, is_scraped=True)
+                continue
+            pending.append((name, url))
+        return pending
+    
+    def _thread_scraper(self):
+        """
+        Detail scraper (and browser) owned by the calling worker thread.
+        The first thread uses self.scraper; others get their own, quit by close().
+        """
+        scraper = getattr(self._local, 'scraper', None)
+        if scraper is None:
+            with self._scrapers_lock:
+                if not self._main_scraper_taken:
+                    self._main_scraper_taken = True
+                    scraper = self.scraper
+                else:
+                    scraper = ScholarshipDetailScraper(remote_url=self.remote_url)
+                    self._worker_scrapers.append(scraper)
+            self._local.scraper = scraper
+        return scraper
+    
+    def _scrape_one(self, name, url, delay):
+        """
+        Scrape and save one scholarship with retries, in a worker thread.
+        
+        Returns:
+            ('ok', filepath), ('not_found', None) or ('failed', last_error)
+        """
+        scraper = self._thread_scraper()
+        last_error = None
+        
+        for attempt in range(1, self.max_retries + 1):
+            print(f"    [SCRAPE] {name[:40]}: attempt {attempt}/{self.max_retries}...")
+            try:
+                scholarship_data = scraper.scrape_scholarship(url, use_selenium=False)
+                
+                if scholarship_data and scholarship_data.get('name'):
+                    filepath = self.save_scholarship_json(scholarship_data, name, url)
+                    
+                    if filepath.exists():
+                        print(f"    [VERIFY] File created: {filepath.name} ({filepath.stat().st_size} bytes)")
+                    else:
+                        print(f"    [ERROR] File was not created!")
+                    return 'ok', filepath
+                else:
+                    last_error = "No data returned from scraper"
+                    print(f"    ✗ {name[:40]}: attempt {attempt} failed: {last_error}")
+            except PageNotFoundError as e:
+                # Page doesn't exist - don't retry, just skip
+                print(f"    [SKIP] Page not found: {str(e)}")
+                return 'not_found', None
+            except Exception as e:
+                last_error = str(e)
+                import traceback
+                print(f"    ✗ {name[:40]}: attempt {attempt} error: {last_error}")
+                print(f"    [TRACEBACK] {traceback.format_exc()}")
+            
+            if attempt < self.max_retries:
+                print(f"    [RETRY] Waiting {delay} seconds before retry...")
+                time.sleep(delay)
+        
+        return 'failed', last_error
+    
+    def _throttled_scrape(self, name, url, delay):
+        """_scrape_one, then hold this worker back `delay` seconds (per-worker rate limit)"""
+        try:
+            return self._scrape_one(name, url, delay)
+        finally:
+            time.sleep(delay)
+    
+    def run(self, delay=1.0, workers=1):
+        """
+        Main method to run the scraping process
+        
+        Args:
+            delay: Seconds each worker waits between scholarships and retries
+            workers: Number of scholarships scraped concurrently, each
+                worker thread with its own browser
+        """
         print("=" * 70)
         print("BigFuture Master Scraper")
         print("=" * 70)
@@ -182,112 +274,91 @@ class MasterScraper:
         # Process scholarships
         processed = 0
         failed = 0
+        already_saved = 0
         skipped = []
         page_not_found = []  # Track scholarships where page doesn't exist
         
-        while True:
-            # Get next unscraped scholarship
-            scholarship = self.get_next_unscraped()
-            
-            if not scholarship:
-                print("\n" + "=" * 70)
-                print("All scholarships have been processed!")
-                print(f"Total processed: {processed}")
-                print(f"Total failed: {failed}")
-                print(f"Total page not found: {len(page_not_found)}")
-                print("=" * 70)
-                break
-            
-            name = scholarship['Scholarship Name']
-            url = scholarship['URL']
-            remaining = self.count_remaining()
-            
-            print(f"[{processed + failed + len(page_not_found) + 1}] Processing: {name[:60]}...")
-            print(f"    URL: {url}")
-            print(f"    Remaining in queue: {remaining}")
-            
-            # Check again before scraping (safety check)
-            if self.is_scraped(name, url, verbose=False):
-                print(f"    [SKIP] Already exists, skipping scrape...")
-                self.update_queue(url, is_scraped=True)
-                processed += 1
-                continue
-            
-            success = False
-            last_error = None
-            is_page_not_found = False
-            
-            for attempt in range(1, self.max_retries + 1):
-                print(f"    [SCRAPE] Attempt {attempt}/{self.max_retries}...")
-                try:
-                    scholarship_data = self.scraper.scrape_scholarship(url, use_selenium=True)
+        pending = self._pending_scholarships()
+        print(f"Scraping {len(pending)} scholarships with {workers} worker(s)...\n")
+        
+        # Rows whose names map to the same JSON file are scraped one at a
+        # time: the next is tried only if the previous one saved nothing, and
+        # once one is saved the rest are marked scraped, as the sequential
+        # queue did through is_scraped()
+        same_file = {}
+        for name, url in pending:
+            same_file.setdefault(self.generate_filename(name, url), []).append((name, url))
+        
+        # Workers only scrape and write their own JSON files; the queue is
+        # updated here, on the thread that owns the database connection
+        executor = ThreadPoolExecutor(max_workers=workers)
+        futures = {}
+        
+        def submit(filename):
+            name, url = same_file[filename].pop(0)
+            futures[executor.submit(self._throttled_scrape, name, url, delay)] = (name, url, filename)
+        
+        try:
+            for filename in same_file:
+                submit(filename)
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, url, filename = futures.pop(future)
+                    outcome, detail = future.result()
+                    print(f"[{processed + failed + len(page_not_found) + already_saved + 1}/{len(pending)}] {name[:60]}")
                     
-                    if scholarship_data and scholarship_data.get('name'):
-                        print(f"    [SAVE] Saving to JSON file...")
-                        filepath = self.save_scholarship_json(scholarship_data, name, url)
-                        
-                        if filepath.exists():
-                            print(f"    [VERIFY] File created: {filepath.name} ({filepath.stat().st_size} bytes)")
-                        else:
-                            print(f"    [ERROR] File was not created!")
-                        
-                        self.update_queue(url, is_scraped=True)
-                        print(f"    ✓ Successfully scraped and saved to {filepath.name}")
+                    if outcome == 'ok':
+                        print(f"    ✓ Successfully scraped and saved to {detail.name}")
                         processed += 1
-                        success = True
-                        break
+                    elif outcome == 'not_found':
+                        # Track page not found separately
+                        page_not_found.append({
+                            'name': name,
+                            'url': url,
+                            'reason': 'Page does not exist'
+                        })
+                        print(f"    [SKIP] Page not found - marked as skipped in queue.")
                     else:
-                        last_error = "No data returned from scraper"
-                        print(f"    ✗ Attempt {attempt} failed: {last_error}")
-                except PageNotFoundError as e:
-                    # Page doesn't exist - don't retry, just skip
-                    is_page_not_found = True
-                    last_error = "Page doesn't exist"
-                    print(f"    [SKIP] Page not found: {str(e)}")
-                    break
-                except Exception as e:
-                    last_error = str(e)
-                    import traceback
-                    print(f"    ✗ Attempt {attempt} error: {last_error}")
-                    print(f"    [TRACEBACK] {traceback.format_exc()}")
-                
-                if attempt < self.max_retries:
-                    print(f"    [RETRY] Waiting {delay} seconds before retry...")
-                    time.sleep(delay)
-            
-            if not success:
-                if is_page_not_found:
-                    # Track page not found separately
-                    page_not_found.append({
-                        'name': name,
-                        'url': url,
-                        'reason': 'Page does not exist'
-                    })
-                    print(f"    [SKIP] Page not found - marked as skipped in queue.")
-                else:
-                    failed += 1
-                    skipped.append({
-                        'name': name,
-                        'url': url,
-                        'reason': last_error or 'Unknown error'
-                    })
-                    print(f"    ✗ All {self.max_retries} attempts failed. Marked as skipped in queue.")
-                
-                # Mark as scraped in queue to prevent infinite retry loop
-                # (even though it failed, we don't want to keep trying it)
-                self.update_queue(url, is_scraped=True)
-            
-            # Wait before next scholarship (only if success or finished retries)
-            if remaining > 1:
-                print(f"    Waiting {delay} seconds before next scholarship...")
-                time.sleep(delay)
-            
-            print()
+                        failed += 1
+                        skipped.append({
+                            'name': name,
+                            'url': url,
+                            'reason': detail or 'Unknown error'
+                        })
+                        print(f"    ✗ All {self.max_retries} attempts failed. Marked as skipped in queue.")
+                    
+                    # Failed pages are marked too, so they aren't retried forever
+                    self.update_queue(url, is_scraped=True)
+                    print()
+                    
+                    waiting = same_file[filename]
+                    if outcome == 'ok':
+                        for other_name, other_url in waiting:
+                            print(f"[{processed + failed + len(page_not_found) + already_saved + 1}/{len(pending)}] {other_name[:60]}")
+                            print(f"    [SKIP] Already scraped: {filename}")
+                            self.update_queue(other_url, is_scraped=True)
+                            already_saved += 1
+                            print()
+                        waiting.clear()
+                    elif waiting:
+                        submit(filename)
+        finally:
+            # On Ctrl-C, drop the scholarships that haven't started
+            executor.shutdown(wait=True, cancel_futures=True)
+        
+        print("\n" + "=" * 70)
+        print("All scholarships have been processed!")
+        print(f"Total processed: {processed}")
+        print(f"Total failed: {failed}")
+        print(f"Total page not found: {len(page_not_found)}")
+        print("=" * 70)
         
         print(f"\nScraping complete!")
         print(f"  Processed: {processed}")
         print(f"  Failed (skipped): {failed}")
         print(f"  Page not found: {len(page_not_found)}")
+        print(f"  Same file already saved: {already_saved}")
         print(f"  Total attempted: {processed + failed + len(page_not_found)}")
         
         if page_not_found:
@@ -317,6 +388,8 @@ if __name__ == '__main__':
     # Parse command line arguments
     delay = 1.0
     max_retries = 3
+    workers = 1
+    remote_url = None
     
     if len(sys.argv) > 1:
         try:
@@ -330,6 +403,20 @@ if __name__ == '__main__':
         except ValueError:
             print(f"Invalid max_retries value: {sys.argv[2]}. Using default: 3 attempts")
     
-    scraper = MasterScraper(max_retries=max_retries)
-    scraper.run(delay=delay)
+    if len(sys.argv) > 3:
+        try:
+            workers = int(sys.argv[3])
+        except ValueError:
+            print(f"Invalid workers value: {sys.argv[3]}. Using default: 1 worker")
+    
+    if len(sys.argv) > 4:
+        # e.g. http://localhost:4444 for a selenium/standalone-chrome container
+        remote_url = sys.argv[4]
+    
+    scraper = MasterScraper(max_retries=max_retries, remote_url=remote_url)
+    try:
+        scraper.run(delay=delay, workers=workers)
+    finally:
+        # Each worker reuses one Chrome for every scholarship; shut them down at the end
+        scraper.close()
 
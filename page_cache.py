@@ -0,0 +1,115 @@
+"""
+Conditional-request cache for scholarship pages
+
+Stores the ETag / Last-Modified validators and a SHA-1 fingerprint of each
+fetched page together with the scholarship data parsed from it, so a
+re-scrape can send If-None-Match / If-Modified-Since and reuse the parsed
+data on a 304, or skip parsing when the downloaded HTML is byte-identical.
+Entries are timestamped, so recently stored data can also be reused without
+asking the server at all (get_fresh).
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Optional
+
+
+def fingerprint(content: bytes) -> str:
+    """SHA-1 hex digest identifying a page body"""
+    return hashlib.sha1(content).hexdigest()
+
+
+class PageCache:
+    """SQLite-backed store of {url: (etag, last_modified, fingerprint, scholarship data)}"""
+
+    def __init__(self, path: str = 'page_cache.db'):
+        self.path = path
+        # One connection shared by scraper threads, serialized by the lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS pages ('
+                'url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, fingerprint TEXT, '
+                'data TEXT NOT NULL, stored_at REAL)'
+            )
+            # Databases created before fingerprints / timestamps were stored
+            columns = {row[1] for row in self._conn.execute('PRAGMA table_info(pages)')}
+            if 'fingerprint' not in columns:
+                self._conn.execute('ALTER TABLE pages ADD COLUMN fingerprint TEXT')
+            if 'stored_at' not in columns:
+                self._conn.execute('ALTER TABLE pages ADD COLUMN stored_at REAL')
+
+    def _row(self, url: str) -> Optional[tuple]:
+        with self._lock:
+            return self._conn.execute(
+                'SELECT etag, last_modified, fingerprint, data FROM pages WHERE url = ?', (url,)
+            ).fetchone()
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Request headers that let the server answer 304 if the page is unchanged"""
+        row = self._row(url)
+        headers = {}
+        if row:
+            etag, last_modified = row[0], row[1]
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Scholarship data stored for url, or None"""
+        row = self._row(url)
+        return json.loads(row[3]) if row else None
+
+    def get_fresh(self, url: str, max_age: float) -> Optional[Dict[str, Any]]:
+        """Stored data for url if it was stored less than max_age seconds ago, else None"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT data FROM pages WHERE url = ? AND stored_at >= ?', (url, time.time() - max_age)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_unchanged(self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None,
+                      page_fingerprint: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Stored data for url if the page is known to be unchanged: its body
+        fingerprint equals the stored one, or else its ETag does, or (only
+        when there is no ETag, as in RFC 9110) its Last-Modified does.
+        None otherwise.
+        """
+        row = self._row(url)
+        if not row:
+            return None
+        stored_etag, stored_last_modified, stored_fingerprint, data = row
+        if page_fingerprint and page_fingerprint == stored_fingerprint:
+            unchanged = True
+        elif etag:
+            # A new ETag means a new page, whatever Last-Modified says
+            unchanged = etag == stored_etag
+        else:
+            unchanged = bool(last_modified) and last_modified == stored_last_modified
+        return json.loads(data) if unchanged else None
+
+    def store(self, url: str, etag: Optional[str], last_modified: Optional[str],
+              scholarship_data: Dict[str, Any], page_fingerprint: Optional[str] = None) -> None:
+        """
+        Remember the validators/fingerprint of a fetched page and the data
+        parsed from it. Stored even without any of them: get_fresh() only
+        needs the timestamp.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO pages (url, etag, last_modified, fingerprint, data, stored_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (url, etag, last_modified, page_fingerprint,
+                 json.dumps(scholarship_data, ensure_ascii=False), time.time()),
+            )
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
@@ -4,78 +4,211 @@ Scrapes scholarship names and links from bigfuture.collegeboard.org/scholarships
 """
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 import csv
-import time
 import json
 from urllib.parse import urljoin, urlparse
 import re
 
 
+# Patterns for API URLs in inline JavaScript, compiled once
+_API_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'["\']([^"\']*api[^"\']*scholarship[^"\']*)["\']',
+    r'["\']([^"\']*scholarship[^"\']*api[^"\']*)["\']',
+    r'url["\']?\s*[:=]\s*["\']([^"\']*scholarship[^"\']*)["\']',
+))
+# Selectors that might contain scholarship links, tried in order
+_SCHOLARSHIP_CLASS_RE = re.compile(r'scholarship', re.I)
+_LINK_SELECTORS = (
+    ('a', {'href': re.compile(r'/scholarships/')}),
+    ('a', {'class': _SCHOLARSHIP_CLASS_RE}),
+    ('div', {'class': _SCHOLARSHIP_CLASS_RE}),
+    ('li', {'class': _SCHOLARSHIP_CLASS_RE}),
+)
+# Only the tags the selectors above can match are built into the tree
+# (each with its whole subtree, so nested links and text are kept)
+_LINK_STRAINER = SoupStrainer([tag for tag, _ in _LINK_SELECTORS])
+
+# Fewer HTML results than this and run() falls back to Selenium
+_MIN_HTML_SCHOLARSHIPS = 100
+
+# Scholarship links on the rendered listing page
+_SCHOLARSHIP_LINK_CSS = "a[href*='/scholarships/']"
+# Counted in the page: returns a number rather than a reference per element
+_LINK_COUNT_JS = f'return document.querySelectorAll("{_SCHOLARSHIP_LINK_CSS}").length;'
+# How long a cached listing page is reused (see BigFutureScraper(cache_path=...))
+_LISTING_CACHE_SECONDS = 3600
+# Resources the Selenium listing scrape never needs (Network.setBlockedURLs patterns)
+_BLOCKED_URLS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.webp', '*.woff', '*.woff2', '*.ttf',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+]
+
+
 class BigFutureScraper:
-    def __init__(self):
+    def __init__(self, cache_path=None):
+        """
+        Args:
+            cache_path: Optional requests-cache SQLite file; GET responses are
+                then reused for an hour, so repeated dev runs don't download
+                the listing page again
+        """
         self.base_url = "https://bigfuture.collegeboard.org/scholarships"
-        self.session = requests.Session()
+        # scheme://host of base_url, for joining root-relative links
+        self._origin = "{0.scheme}://{0.netloc}".format(urlparse(self.base_url))
+        self.session = self._make_session(cache_path)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
+            # Only encodings requests can decode here: 'br' when brotli is installed
+            'Accept-Encoding': DEFAULT_ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
+        # Retry the listing fetch on rate limiting and transient gateway errors
+        adapter = HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.3,
+                                                status_forcelist=(429, 502, 503, 504)))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.scholarships = []
+        # Listing page HTML, fetched once and shared by find_api_endpoint()
+        # and scrape_from_html()
+        self._listing_html = None
+        # Started on first use and reused across scrape_with_selenium() calls
+        # (see close())
+        self.driver = None
+
+    @staticmethod
+    def _make_session(cache_path):
+        """requests.Session, or a requests-cache CachedSession when cache_path is given"""
+        if cache_path:
+            try:
+                import requests_cache
+            except ImportError:
+                print("requests-cache not available. Install it with: pip install requests-cache")
+                print("Fetching without a cache...")
+            else:
+                return requests_cache.CachedSession(cache_path, backend='sqlite',
+                                                    expire_after=_LISTING_CACHE_SECONDS,
+                                                    allowable_methods=('GET',))
+        return requests.Session()
+
+    def _get_driver(self):
+        """Chrome instance shared by every scrape_with_selenium() call until close()"""
+        if self.driver is None:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+            
+            options = Options()
+            options.add_argument('--headless')
+            options.add_argument('--no-sandbox')
+            options.add_argument('--disable-dev-shm-usage')
+            options.add_argument('--disable-blink-features=AutomationControlled')
+            options.add_experimental_option("excludeSwitches", ["enable-automation"])
+            options.add_experimental_option('useAutomationExtension', False)
+            # driver.get() returns at DOMContentLoaded; the wait for the first
+            # link covers the rest. Images are not even requested (2 = block)
+            options.page_load_strategy = 'eager'
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+            })
+            driver = webdriver.Chrome(options=options)
+            # Only the links are read: skip images, fonts and trackers (CSS
+            # stays, the infinite scroll depends on the page layout)
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URLS})
+            self.driver = driver
+        return self.driver
+
+    def close(self):
+        """Quit the shared Chrome instance, if one was started"""
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _get_listing_html(self):
+        """HTML of the listing page, downloaded on the first call only"""
+        if self._listing_html is None:
+            response = self.session.get(self.base_url, timeout=30)
+            response.raise_for_status()
+            self._listing_html = response.text
+        return self._listing_html
+
+    def _absolute_url(self, href):
+        """urljoin(self.base_url, href), without parsing the common absolute and root-relative cases"""
+        # urljoin strips tabs and newlines; leave such hrefs to it
+        if '\t' in href or '\r' in href or '\n' in href:
+            return urljoin(self.base_url, href)
+        if href.startswith(('https://', 'http://')):
+            return href
+        # Dot segments ("/../") are left to urljoin, which resolves them
+        if href.startswith('/') and not href.startswith('//') and '/.' not in href:
+            return self._origin + href
+        return urljoin(self.base_url, href)
 
     def find_api_endpoint(self):
         """Try to find the API endpoint by inspecting the page"""
         print("Fetching initial page to find data source...")
         try:
-            response = self.session.get(self.base_url, timeout=30)
-            response.raise_for_status()
+            html = self._get_listing_html()
             
-            # Look for API endpoints in the HTML/JavaScript
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Look for API endpoints in the HTML/JavaScript; only <script>
+            # tags are built into the tree
+            soup = BeautifulSoup(html, 'lxml', parse_only=SoupStrainer('script'))
             
             # Check for JSON-LD or data attributes
             scripts = soup.find_all('script')
             for script in scripts:
                 if script.string:
                     # Look for API URLs in JavaScript
-                    api_patterns = [
-                        r'["\']([^"\']*api[^"\']*scholarship[^"\']*)["\']',
-                        r'["\']([^"\']*scholarship[^"\']*api[^"\']*)["\']',
-                        r'url["\']?\s*[:=]\s*["\']([^"\']*scholarship[^"\']*)["\']',
-                    ]
-                    for pattern in api_patterns:
-                        matches = re.findall(pattern, script.string, re.IGNORECASE)
-                        if matches:
-                            print(f"Found potential API endpoint: {matches[0]}")
-                            return matches[0]
+                    for pattern in _API_PATTERNS:
+                        # First hit only; no list of every match
+                        match = pattern.search(script.string)
+                        if match:
+                            print(f"Found potential API endpoint: {match.group(1)}")
+                            return match.group(1)
             
             return None
         except Exception as e:
             print(f"Error fetching page: {e}")
             return None
 
-    def scrape_from_html(self):
-        """Scrape scholarships directly from HTML"""
+    def scrape_from_html(self, min_results=0):
+        """
+        Scrape scholarships directly from HTML
+
+        Args:
+            min_results: Skip parsing (and return []) when the page cannot
+                hold this many: every result's href contains "scholarship",
+                so the page needs at least that many occurrences
+        """
         print("Attempting to scrape from HTML...")
         try:
-            response = self.session.get(self.base_url, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            scholarships = []
+            html = self._get_listing_html()
+            if min_results and html.lower().count('scholarship') < min_results:
+                # Typically the JavaScript shell of the page, without the list
+                print("Page has too few scholarship links to parse")
+                return []
+            soup = BeautifulSoup(html, 'lxml', parse_only=_LINK_STRAINER)
+            # Keyed by URL: duplicates are dropped as they are found, keeping
+            # the first name seen (as the Selenium path does)
+            scholarships = {}
             
             # Try multiple selectors that might contain scholarship links
-            selectors = [
-                ('a', {'href': re.compile(r'/scholarships/')}),
-                ('a', {'class': re.compile(r'scholarship', re.I)}),
-                ('div', {'class': re.compile(r'scholarship', re.I)}),
-                ('li', {'class': re.compile(r'scholarship', re.I)}),
-            ]
-            
-            for tag, attrs in selectors:
+            for tag, attrs in _LINK_SELECTORS:
                 elements = soup.find_all(tag, attrs)
                 if elements:
                     print(f"Found {len(elements)} elements with selector: {tag}, {attrs}")
@@ -83,26 +216,17 @@ class BigFutureScraper:
                         link_elem = elem if tag == 'a' else elem.find('a')
                         if link_elem and link_elem.get('href'):
                             href = link_elem.get('href')
-                            full_url = urljoin(self.base_url, href)
+                            full_url = self._absolute_url(href)
                             name = link_elem.get_text(strip=True) or elem.get_text(strip=True)
-                            if name and 'scholarship' in href.lower():
-                                scholarships.append({
+                            if name and 'scholarship' in href.lower() and full_url not in scholarships:
+                                scholarships[full_url] = {
                                     'name': name,
                                     'url': full_url
-                                })
+                                }
                     if scholarships:
                         break
             
-            # Remove duplicates
-            seen = set()
-            unique_scholarships = []
-            for item in scholarships:
-                key = (item['name'], item['url'])
-                if key not in seen:
-                    seen.add(key)
-                    unique_scholarships.append(item)
-            
-            return unique_scholarships
+            return list(scholarships.values())
             
         except Exception as e:
             print(f"Error scraping from HTML: {e}")
@@ -115,29 +239,27 @@ class BigFutureScraper:
             from selenium.webdriver.common.by import By
             from selenium.webdriver.support.ui import WebDriverWait
             from selenium.webdriver.support import expected_conditions as EC
-            from selenium.webdriver.chrome.options import Options
-            from selenium.common.exceptions import TimeoutException, NoSuchElementException
+            from selenium.common.exceptions import TimeoutException
         except ImportError:
             print("Selenium not available. Install it with: pip install selenium")
             return []
 
         print("Using Selenium to scrape JavaScript-rendered content...")
         
-        options = Options()
-        options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        
-        driver = None
         try:
-            driver = webdriver.Chrome(options=options)
+            driver = self._get_driver()
+            # The browser outlives this call; start each scrape without the
+            # previous one's cookies
+            driver.delete_all_cookies()
             driver.get(self.base_url)
             
-            # Wait for page to load
-            time.sleep(3)
+            # Wait for the first scholarship links rather than a fixed 3 seconds
+            try:
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, _SCHOLARSHIP_LINK_CSS))
+                )
+            except TimeoutException:
+                print("No scholarship links after 10 seconds, scrolling anyway...")
             
             scholarships = []
             last_count = 0
@@ -148,12 +270,17 @@ class BigFutureScraper:
             while scroll_attempts < max_scrolls:
                 # Scroll to bottom
                 driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)  # Wait for content to load
+                # Wait for content to load: until new links appear, at most 2 seconds
+                try:
+                    WebDriverWait(driver, 2, poll_frequency=0.2).until(
+                        lambda d: d.execute_script(_LINK_COUNT_JS) > last_count
+                    )
+                except TimeoutException:
+                    pass
                 
                 # Find all scholarship links
                 try:
-                    links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/scholarships/']")
-                    current_count = len(links)
+                    current_count = driver.execute_script(_LINK_COUNT_JS)
                     
                     if current_count == last_count:
                         scroll_attempts += 1
@@ -170,32 +297,34 @@ class BigFutureScraper:
             
             # Extract all scholarship data
             print("Extracting scholarship data...")
-            links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/scholarships/']")
+            # One page_source transfer, parsed here, instead of two or three
+            # WebDriver calls per link
+            page_url = driver.current_url
+            soup = BeautifulSoup(driver.page_source, 'lxml')
+            links = soup.select(_SCHOLARSHIP_LINK_CSS)
             
             seen_urls = set()
             for link in links:
-                try:
-                    url = link.get_attribute('href')
-                    if url and url not in seen_urls:
-                        seen_urls.add(url)
-                        name = link.text.strip() or link.get_attribute('title') or url.split('/')[-1]
-                        if name:
-                            scholarships.append({
-                                'name': name,
-                                'url': url
-                            })
-                except Exception as e:
-                    continue
+                # Resolved like the element's href property
+                url = urljoin(page_url, link['href'])
+                if url not in seen_urls:
+                    seen_urls.add(url)
+                    # Whitespace collapsed, like Selenium's .text
+                    name = ' '.join(link.get_text().split()) or link.get('title') or url.split('/')[-1]
+                    if name:
+                        scholarships.append({
+                            'name': name,
+                            'url': url
+                        })
             
             print(f"Extracted {len(scholarships)} unique scholarships")
             return scholarships
             
         except Exception as e:
             print(f"Error with Selenium: {e}")
+            # Don't reuse a browser that may be in a bad state
+            self.close()
             return []
-        finally:
-            if driver:
-                driver.quit()
 
     def save_to_csv(self, scholarships, filename='scholarships.csv'):
         """Save scholarships to CSV file"""
@@ -205,14 +334,10 @@ class BigFutureScraper:
         
         print(f"Saving {len(scholarships)} scholarships to {filename}...")
         with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['Scholarship Name', 'URL']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            for scholarship in scholarships:
-                writer.writerow({
-                    'Scholarship Name': scholarship['name'],
-                    'URL': scholarship['url']
-                })
+            # Plain tuples through writerows: no dict per row
+            writer = csv.writer(csvfile)
+            writer.writerow(('Scholarship Name', 'URL'))
+            writer.writerows((scholarship['name'], scholarship['url']) for scholarship in scholarships)
         
         print(f"Successfully saved {len(scholarships)} scholarships to {filename}")
 
@@ -228,10 +353,10 @@ class BigFutureScraper:
             scholarships = self.scrape_with_selenium()
         else:
             # Try HTML scraping first
-            scholarships = self.scrape_from_html()
+            scholarships = self.scrape_from_html(min_results=_MIN_HTML_SCHOLARSHIPS)
             
             # If HTML scraping didn't work well, try Selenium
-            if len(scholarships) < 100:
+            if len(scholarships) < _MIN_HTML_SCHOLARSHIPS:
                 print(f"Only found {len(scholarships)} scholarships via HTML. Trying Selenium...")
                 scholarships = self.scrape_with_selenium()
         
@@ -246,7 +371,9 @@ if __name__ == '__main__':
     import sys
     
     use_selenium = '--selenium' in sys.argv or '-s' in sys.argv
+    # Reuse the downloaded listing page for an hour (needs requests-cache)
+    cache_path = 'listing_cache' if '--cache' in sys.argv else None
     
-    scraper = BigFutureScraper()
-    scraper.run(use_selenium=use_selenium)
+    with BigFutureScraper(cache_path=cache_path) as scraper:
+        scraper.run(use_selenium=use_selenium)
 
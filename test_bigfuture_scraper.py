@@ -3,11 +3,14 @@ Comprehensive tests for BigFuture scraper
 """
 
 import unittest
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import Mock, patch
 import json
 import os
-from selenium.common.exceptions import NoSuchElementException
-from bigfuture_scraper import BigFutureScraper
+import tempfile
+from bs4 import BeautifulSoup
+from selenium.common.exceptions import WebDriverException
+from bigfuture_scraper import BigFutureScraper, PageContext, _is_location_line
+from page_cache import fingerprint
 
 
 class TestBigFutureScraper(unittest.TestCase):
@@ -24,70 +27,56 @@ class TestBigFutureScraper(unittest.TestCase):
         self.assertIsNotNone(self.scraper.selectors)
         self.assertIn('name', self.scraper.selectors)
     
-    @patch('bigfuture_scraper.webdriver.Chrome')
-    def test_extract_name_with_specific_selector(self, mock_chrome):
+    def _soup(self, html):
+        """Parse an HTML fragment the way scrape() parses the page snapshot"""
+        return BeautifulSoup(f"<html><body>{html}</body></html>", 'lxml')
+    
+    def _soup_from_lines(self, text):
+        """Build a snapshot whose body text is the given lines, one div each"""
+        return self._soup(''.join(f"<div>{line}</div>" for line in text.split('\n')))
+    
+    def _context(self, soup):
+        """Page context as built once per page by _extract_all"""
+        return PageContext.from_soup(soup)
+    
+    def test_extract_name_with_specific_selector(self):
         """Test name extraction using the specific CSS selector"""
-        from selenium.webdriver.common.by import By
-        
-        # Mock driver and element
-        mock_driver = MagicMock()
-        mock_elem = MagicMock()
-        mock_elem.text = "ROTC Scholarship"
-        
-        # Configure find_element to return the element only for the CSS selector
-        def find_element_side_effect(by, value):
-            if by == By.CSS_SELECTOR and value == 'div.sc-c64e2d48-3':
-                return mock_elem
-            raise NoSuchElementException()
+        soup = self._soup('<h1>BigFuture</h1><div class="sc-c64e2d48-3 abc">ROTC Scholarship</div>')
         
-        mock_driver.find_element.side_effect = find_element_side_effect
-        mock_chrome.return_value = mock_driver
-        
-        name = self.scraper._extract_name(mock_driver)
+        name = self.scraper._extract_name(self._context(soup))
         self.assertEqual(name, "ROTC Scholarship")
-        # Verify it used the specific CSS selector
-        mock_driver.find_element.assert_called_with(By.CSS_SELECTOR, 'div.sc-c64e2d48-3')
     
-    @patch('bigfuture_scraper.webdriver.Chrome')
-    def test_extract_foundation_organization_name(self, mock_chrome):
+    def test_extract_foundation_organization_name(self):
         """Test that foundation field extracts organization name, not grade level"""
-        from selenium.webdriver.common.by import By
-        
-        mock_driver = MagicMock()
-        
-        # Mock page text that includes organization name
-        mock_body = MagicMock()
-        mock_body.text = """ROTC Scholarship
+        # Page text that includes organization name
+        soup = self._soup_from_lines("""ROTC Scholarship
 Northwest Florida Military Officers Association
 About the Scholarship
 Opens: 2/1/2025
 Closes: 3/1/2025
-The ROTC Scholarship is available..."""
-        
-        # Configure find_element to return body when called with TAG_NAME and "body"
-        def find_element_side_effect(by, value):
-            if by == By.TAG_NAME and value == "body":
-                return mock_body
-            raise NoSuchElementException()
-        
-        mock_driver.find_element.side_effect = find_element_side_effect
-        mock_driver.find_elements.return_value = []  # For the alternative path
+The ROTC Scholarship is available...""")
         
-        foundation = self.scraper._extract_foundation(mock_driver)
+        foundation = self.scraper._extract_foundation(self._context(soup))
         # Should extract organization name, not "College junior or senior"
         self.assertIsNotNone(foundation)
         self.assertIn("Association", foundation or "")
         self.assertNotIn("junior", foundation or "")
         self.assertNotIn("senior", foundation or "")
     
-    @patch('bigfuture_scraper.webdriver.Chrome')
-    def test_extract_location_only_location_fields(self, mock_chrome):
-        """Test that location field only contains location info, not GPA/Activities"""
-        mock_driver = MagicMock()
+    def test_extract_foundation_before_requirements_mention(self):
+        """Test that a heading merely containing "Requirements" anchors the foundation search"""
+        soup = self._soup_from_lines("""ROTC Scholarship
+Northwest Florida Military Officers Association
+Eligibility Requirements
+Member of ROTC""")
         
-        # Mock page text with Details section
-        mock_body = MagicMock()
-        mock_body.text = """Details
+        foundation = self.scraper._extract_foundation(self._context(soup))
+        self.assertEqual(foundation, "Northwest Florida Military Officers Association")
+    
+    def test_extract_location_only_location_fields(self):
+        """Test that location field only contains location info, not GPA/Activities"""
+        # Page text with Details section
+        soup = self._soup_from_lines("""Details
 Pursued Degree Level
 Bachelor's Degree
 Current Grade
@@ -98,10 +87,9 @@ State: FL
 County: Okaloosa, Walton, Santa Rosa
 Minimum GPA
 Activities
-Community Service"""
-        mock_driver.find_element.return_value = mock_body
+Community Service""")
         
-        details = self.scraper._extract_details(mock_driver)
+        details = self.scraper._extract_details(self._context(soup))
         
         self.assertIsNotNone(details)
         self.assertIn('location', details)
@@ -119,51 +107,241 @@ Community Service"""
     
     def test_location_filtering_logic(self):
         """Test the logic for filtering location vs non-location fields"""
-        location_keywords = ['Country', 'State', 'County', 'City']
-        non_location_keywords = ['GPA', 'Activities', 'Community Service']
-        
         # Test location line
-        location_line = "Country: US, State: FL"
-        is_location = (any(kw in location_line for kw in location_keywords) and 
-                      not any(kw in location_line for kw in non_location_keywords))
-        self.assertTrue(is_location)
+        self.assertTrue(_is_location_line("Country: US, State: FL"))
+        self.assertTrue(_is_location_line("County: Okaloosa, Walton, Santa Rosa"))
         
-        # Test non-location line
-        non_location_line = "Minimum GPA, Activities"
-        is_location = (any(kw in non_location_line for kw in location_keywords) and 
-                       not any(kw in non_location_line for kw in non_location_keywords))
-        self.assertFalse(is_location)
+        # Test non-location lines
+        self.assertFalse(_is_location_line("Minimum GPA, Activities"))
+        self.assertFalse(_is_location_line("State Community Service Award"))
+        self.assertFalse(_is_location_line("Bachelor's Degree"))
     
-    @patch('bigfuture_scraper.webdriver.Chrome')
-    def test_extract_dates(self, mock_chrome):
+    def test_extract_details_from_accordion(self):
+        """Test accordion details, including panels that are collapsed (hidden) in the DOM"""
+        soup = self._soup("""
+<div class="cb-accordion-container">
+  <div class="cb-accordion-heading-title"><span>Pursued Degree Level</span></div>
+  <div class="cb-accordion-panel-content" aria-hidden="true">
+    <span class="sc-2872267-3">Bachelor's Degree</span><span class="sc-2872267-3">Master's Degree</span>
+  </div>
+</div>
+<div class="cb-accordion-container">
+  <div class="cb-accordion-heading-title"><span>Location</span></div>
+  <div class="cb-accordion-panel-content">
+    <ul class="eligibility-criteria-locations-list-item-id">
+      <li class="sc-2872267-2">Country: US</li><li class="sc-2872267-2">State: FL</li>
+    </ul>
+  </div>
+</div>""")
+        
+        details = self.scraper._extract_details(self._context(soup))
+        self.assertEqual(details['pursued_degree_level'], "Bachelor's Degree, Master's Degree")
+        self.assertEqual(details['location'], {'country': 'US', 'state': 'FL'})
+    
+    def test_collapsed_panels_need_no_expanding(self):
+        """Test that hidden panels with content are read as is, empty ones trigger expansion"""
+        collapsed = self._soup("""
+<div class="cb-accordion-container">
+  <div class="cb-accordion-heading-title"><span>Current Grade</span></div>
+  <div class="cb-accordion-panel-content" aria-hidden="true" style="display: none">College Junior</div>
+</div>""")
+        unrendered = self._soup("""
+<div class="cb-accordion-container">
+  <div class="cb-accordion-heading-title"><span>Current Grade</span></div>
+  <div class="cb-accordion-panel-content"></div>
+</div>""")
+        
+        self.assertFalse(self.scraper._has_unrendered_panels(collapsed))
+        self.assertTrue(self.scraper._has_unrendered_panels(unrendered))
+    
+    def test_extract_dates(self):
         """Test date extraction"""
-        mock_driver = MagicMock()
-        mock_body = MagicMock()
-        mock_body.text = "Opens: 2/1/2025\nCloses: 3/1/2025"
-        mock_driver.find_element.return_value = mock_body
+        soup = self._soup('<p>Opens: <span>2/1/2025</span></p><p>Closes: 3/1/2025</p>')
         
-        dates = self.scraper._extract_dates(mock_driver)
+        dates = self.scraper._extract_dates(self._context(soup))
         self.assertIsNotNone(dates)
         self.assertEqual(dates['opens'], '2/1/2025')
         self.assertEqual(dates['closes'], '3/1/2025')
     
-    @patch('bigfuture_scraper.webdriver.Chrome')
-    def test_extract_requirements(self, mock_chrome):
+    def test_extract_requirements(self):
         """Test requirements extraction"""
-        mock_driver = MagicMock()
-        mock_body = MagicMock()
-        mock_body.text = """Requirements
+        soup = self._soup_from_lines("""Requirements
 Member of ROTC
 Minimum 3.00 GPA
 Resident of Florida
-Details"""
-        mock_driver.find_element.return_value = mock_body
+Details""")
         
-        requirements = self.scraper._extract_requirements(mock_driver)
+        requirements = self.scraper._extract_requirements(self._context(soup))
         self.assertIsNotNone(requirements)
         self.assertGreater(len(requirements), 0)
         self.assertIn('ROTC', requirements[0])
     
+    def test_inline_markup_stays_on_one_line(self):
+        """Test that body text has one line per block, not per text node"""
+        soup = self._soup("""
+<h2>Requirements</h2>
+<ul>
+  <li>Must be a <strong>resident</strong> of Florida</li>
+  <li>Minimum <a href="#">3.0 GPA</a></li>
+</ul>
+<h2>Details</h2>""")
+        
+        requirements = self.scraper._extract_requirements(self._context(soup))
+        self.assertEqual(requirements, ['Must be a resident of Florida', 'Minimum 3.0 GPA'])
+    
+    def test_scrape_fast_skips_selenium_for_static_pages(self):
+        """Test that a complete static page is parsed without starting Chrome"""
+        static_page = Mock(text="""<html><body>
+<div class="sc-c64e2d48-3">ROTC Scholarship</div>
+<div class="cb-accordion-container">
+  <div class="cb-accordion-heading-title"><span>Current Grade</span></div>
+  <div class="cb-accordion-panel-content"><span class="sc-2872267-3">College Junior</span></div>
+</div></body></html>""")
+        
+        with patch.object(self.scraper.session, 'get', return_value=static_page), \
+                patch.object(self.scraper, '_scrape_rendered') as mock_render:
+            data = self.scraper.scrape_fast(self.test_url)
+        
+        mock_render.assert_not_called()
+        self.assertEqual(data['name'], 'ROTC Scholarship')
+        self.assertEqual(data['details'], {'current_grade': 'College Junior'})
+        
+        # Without the name the page needs rendering
+        with patch.object(self.scraper.session, 'get', return_value=Mock(text='<html></html>')), \
+                patch.object(self.scraper, '_scrape_rendered', return_value={'name': 'Rendered'}) as mock_render:
+            data = self.scraper.scrape_fast(self.test_url)
+        
+        mock_render.assert_called_once_with(self.test_url)
+        self.assertEqual(data, {'name': 'Rendered'})
+    
+    def test_scrape_fast_reuses_cached_data_on_304(self):
+        """Test that an unchanged page (304) returns the cached data without parsing"""
+        with tempfile.TemporaryDirectory() as tmp:
+            scraper = BigFutureScraper(cache_path=os.path.join(tmp, 'cache.db'))
+            cached = {'name': 'ROTC Scholarship', 'url': self.test_url}
+            scraper.cache.store(self.test_url, '"abc"', None, cached)
+            self.assertEqual(scraper.cache.conditional_headers(self.test_url), {'If-None-Match': '"abc"'})
+            
+            with patch.object(scraper.session, 'get', return_value=Mock(status_code=304)) as mock_get, \
+                    patch.object(scraper, '_scrape_static') as mock_parse:
+                data = scraper.scrape_fast(self.test_url)
+            scraper.cache.close()
+        
+        self.assertEqual(data, cached)
+        mock_parse.assert_not_called()
+        self.assertEqual(mock_get.call_args.kwargs['headers'], {'If-None-Match': '"abc"'})
+    
+    def test_unchanged_pages_skip_parsing_and_rendering(self):
+        """Test that a matching body fingerprint or HEAD ETag reuses the stored data"""
+        html = b'<html><body><div class="sc-c64e2d48-3">ROTC Scholarship</div></body></html>'
+        with tempfile.TemporaryDirectory() as tmp:
+            scraper = BigFutureScraper(cache_path=os.path.join(tmp, 'cache.db'))
+            cached = {'name': 'ROTC Scholarship', 'url': self.test_url}
+            scraper.cache.store(self.test_url, '"v1"', None, cached, fingerprint(html))
+            
+            # No validators on the response, but the same bytes
+            page = Mock(status_code=200, content=html, headers={})
+            with patch.object(scraper.session, 'get', return_value=page), \
+                    patch.object(scraper, '_scrape_static') as mock_parse:
+                self.assertEqual(scraper.scrape_fast(self.test_url), cached)
+            mock_parse.assert_not_called()
+            
+            # HEAD shows the same ETag: Chrome is never started
+            with patch.object(scraper.session, 'head', return_value=Mock(headers={'ETag': '"v1"'})), \
+                    patch.object(scraper, '_scrape_rendered') as mock_render:
+                self.assertEqual(scraper.scrape(self.test_url), cached)
+            mock_render.assert_not_called()
+            
+            with patch.object(scraper.session, 'head', return_value=Mock(headers={'ETag': '"v2"'})), \
+                    patch.object(scraper, '_scrape_rendered', return_value={'name': 'New'}) as mock_render:
+                self.assertEqual(scraper.scrape(self.test_url), {'name': 'New'})
+            self.assertEqual(scraper.cache.get(self.test_url), {'name': 'New'})
+            scraper.cache.close()
+    
+    def test_changed_etag_overrides_same_last_modified(self):
+        """Test that Last-Modified only decides when there is no ETag, and rendered pages aren't cached"""
+        with tempfile.TemporaryDirectory() as tmp:
+            scraper = BigFutureScraper(cache_path=os.path.join(tmp, 'cache.db'))
+            cached = {'name': 'ROTC Scholarship', 'url': self.test_url}
+            last_modified = 'Wed, 01 Jan 2025 00:00:00 GMT'
+            scraper.cache.store(self.test_url, '"v1"', last_modified, cached)
+            
+            self.assertIsNone(scraper.cache.get_unchanged(self.test_url, etag='"v2"', last_modified=last_modified))
+            self.assertEqual(scraper.cache.get_unchanged(self.test_url, last_modified=last_modified), cached)
+            
+            # Static HTML without the data: the rendered result isn't stored
+            # under the static page's fingerprint
+            html = b'<html><body></body></html>'
+            page = Mock(status_code=200, content=html, text=html.decode(), headers={'ETag': '"v3"'})
+            with patch.object(scraper.session, 'get', return_value=page), \
+                    patch.object(scraper, '_scrape_rendered', return_value={'name': 'Rendered'}):
+                self.assertEqual(scraper.scrape_fast(self.test_url), {'name': 'Rendered'})
+            self.assertIsNone(scraper.cache.get_unchanged(self.test_url, page_fingerprint=fingerprint(html)))
+            scraper.cache.close()
+    
+    def test_fresh_cache_entries_skip_the_network(self):
+        """Test that data cached within cache_max_age is reused unless forced"""
+        with tempfile.TemporaryDirectory() as tmp:
+            scraper = BigFutureScraper(cache_path=os.path.join(tmp, 'cache.db'), cache_max_age=3600)
+            cached = {'name': 'ROTC Scholarship', 'url': self.test_url}
+            scraper.cache.store(self.test_url, '"v1"', None, cached)
+            
+            with patch.object(scraper.session, 'get') as mock_get, \
+                    patch.object(scraper.session, 'head') as mock_head:
+                self.assertEqual(scraper.scrape_fast(self.test_url), cached)
+                self.assertEqual(scraper.scrape(self.test_url), cached)
+            mock_get.assert_not_called()
+            mock_head.assert_not_called()
+            
+            # Forced: scraped again even though the ETag is unchanged
+            with patch.object(scraper.session, 'head', return_value=Mock(headers={'ETag': '"v1"'})), \
+                    patch.object(scraper, '_scrape_rendered', return_value={'name': 'New'}):
+                self.assertEqual(scraper.scrape(self.test_url, force=True), {'name': 'New'})
+            self.assertEqual(scraper.cache.get(self.test_url), {'name': 'New'})
+            scraper.cache.close()
+    
+    def test_pages_without_validators_are_cached_for_max_age(self):
+        """Test that scrape() results are reused within cache_max_age even without ETag/Last-Modified"""
+        with tempfile.TemporaryDirectory() as tmp:
+            scraper = BigFutureScraper(cache_path=os.path.join(tmp, 'cache.db'), cache_max_age=3600)
+            with patch.object(scraper.session, 'head', return_value=Mock(headers={})), \
+                    patch.object(scraper, '_scrape_rendered', return_value={'name': 'New'}) as mock_render:
+                self.assertEqual(scraper.scrape(self.test_url), {'name': 'New'})
+                self.assertEqual(scraper.scrape(self.test_url), {'name': 'New'})
+            mock_render.assert_called_once_with(self.test_url)
+            scraper.cache.close()
+    
+    def test_scrape_many_keeps_input_order(self):
+        """Test that the driver pool returns one result per URL, in order"""
+        urls = [f'https://example.com/scholarships/{i}' for i in range(10)]
+        with patch.object(BigFutureScraper, '_get_driver') as mock_driver, \
+                patch.object(BigFutureScraper, '_scrape_rendered',
+                             autospec=True, side_effect=lambda scraper, url: {'url': url}):
+            results = self.scraper.scrape_many(urls, workers=3)
+        
+        self.assertEqual([result['url'] for result in results], urls)
+        self.assertEqual(mock_driver.call_count, 3)
+    
+    def test_remote_url_starts_a_grid_session(self):
+        """Test that remote_url creates a Remote session instead of a local Chrome"""
+        scraper = BigFutureScraper(remote_url='http://localhost:4444')
+        with patch('bigfuture_scraper.webdriver.Remote') as mock_remote, \
+                patch('bigfuture_scraper.webdriver.Chrome') as mock_chrome:
+            scraper._setup_driver()
+        
+        mock_chrome.assert_not_called()
+        self.assertEqual(mock_remote.call_args.kwargs['command_executor'], 'http://localhost:4444')
+    
+    def test_failed_driver_setup_quits_the_browser(self):
+        """Test that a Chrome whose CDP setup fails is quit before the launch is retried"""
+        with patch('bigfuture_scraper.webdriver.Chrome') as mock_chrome, \
+                patch('bigfuture_scraper.time.sleep'):
+            mock_chrome.return_value.execute_cdp_cmd.side_effect = WebDriverException('CDP failed')
+            with self.assertRaises(WebDriverException):
+                self.scraper._get_driver()
+        
+        self.assertEqual(mock_chrome.return_value.quit.call_count, mock_chrome.call_count)
+    
     def test_save_to_json(self):
         """Test JSON saving functionality"""
         test_data = {
@@ -205,6 +383,9 @@ class TestBigFutureScraperRealData(unittest.TestCase):
         except FileNotFoundError:
             self.example_data = None
     
+    def tearDown(self):
+        self.scraper.close()
+    
     def test_scrape_real_url_and_print(self):
         """Actually scrape the test URL and print the results for visual inspection"""
         test_url = "https://bigfuture.collegeboard.org/scholarships/rotc-scholarship"